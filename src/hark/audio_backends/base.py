@@ -2,10 +2,12 @@
 
 These define the contracts that audio backend implementations must follow.
 Using Protocol allows for structural subtyping (duck typing with type safety).
+The bundled backends also subclass the protocol explicitly, so type checkers
+verify them against it and ``isinstance`` resolves them nominally.
 """
 
 from dataclasses import dataclass
-from typing import Protocol, runtime_checkable
+from typing import Any, Protocol, runtime_checkable
 
 __all__ = [
     "LoopbackDeviceInfo",
@@ -14,7 +16,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoopbackDeviceInfo:
     """Information about a loopback/monitor audio device.
 
@@ -36,7 +38,7 @@ class LoopbackDeviceInfo:
     sample_rate: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RecordingConfig:
     """Platform-specific configuration for recording from a loopback device.
 
@@ -56,8 +58,44 @@ class RecordingConfig:
     device: int | str | None
 
 
+# Public method names of each runtime protocol using _LoopbackBackendMeta
+_PROTOCOL_MEMBERS: dict[type, frozenset[str]] = {}
+
+
+class _LoopbackBackendMeta(type(Protocol)):
+    """Protocol metaclass with a cheaper runtime ``isinstance`` check.
+
+    ``typing`` re-derives the protocol members on every ``isinstance`` call
+    (Python < 3.12). Here they are collected once, when the protocol class is
+    created, explicit subclasses match on their MRO alone, and anything else
+    is reduced to attribute lookups on the instance.
+
+    The collected members are kept in ``_PROTOCOL_MEMBERS`` rather than on the
+    class: ``typing`` treats any extra class attribute (or annotation visible
+    from the class) as a data member, which makes ``issubclass()`` against the
+    protocol raise on Python 3.11.
+    """
+
+    def __init__(cls, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        if cls.__dict__.get("_is_protocol", False):
+            _PROTOCOL_MEMBERS[cls] = frozenset(
+                name
+                for name, value in vars(cls).items()
+                if callable(value) and not name.startswith("_")
+            )
+
+    def __instancecheck__(cls, instance: object) -> bool:
+        if not cls.__dict__.get("_is_protocol", False):
+            return super().__instancecheck__(instance)
+        # Nominal subclasses (the bundled backends) need no structural walk.
+        if cls in type(instance).__mro__:
+            return True
+        return all(getattr(instance, name, None) is not None for name in _PROTOCOL_MEMBERS[cls])
+
+
 @runtime_checkable
-class LoopbackBackend(Protocol):
+class LoopbackBackend(Protocol, metaclass=_LoopbackBackendMeta):
     """Protocol for platform-specific loopback audio capture backends.
 
     Implementations must provide methods to discover and list loopback
@@ -110,6 +148,15 @@ class LoopbackBackend(Protocol):
         """
         ...
 
+    def invalidate_cache(self) -> None:
+        """Discard any cached device enumeration.
+
+        Backends may cache the devices they discover. After this call the
+        next lookup queries the system again, picking up devices that were
+        added or removed and changes to the default output.
+        """
+        ...
+
     def get_recording_config(self, device_id: str | int | None) -> RecordingConfig:
         """Get configuration for recording from a loopback device.
 
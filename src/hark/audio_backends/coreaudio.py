@@ -9,7 +9,7 @@ from typing import Any, cast
 
 import sounddevice as sd
 
-from hark.audio_backends.base import LoopbackDeviceInfo, RecordingConfig
+from hark.audio_backends.base import LoopbackBackend, LoopbackDeviceInfo, RecordingConfig
 from hark.platform import is_macos
 
 __all__ = ["CoreAudioBackend"]
@@ -34,7 +34,7 @@ def _check_sounddevice_available() -> bool:
     return _SOUNDDEVICE_AVAILABLE
 
 
-class CoreAudioBackend:
+class CoreAudioBackend(LoopbackBackend):
     """Core Audio loopback backend using sounddevice for BlackHole detection.
 
     Uses sounddevice (which wraps PortAudio/Core Audio on macOS) to discover
@@ -50,7 +50,11 @@ class CoreAudioBackend:
     _DEFAULT_SAMPLE_RATE = 44100.0
 
     # BlackHole detection pattern (only supported virtual device for now)
-    _BLACKHOLE_PATTERN = r"blackhole"
+    _BLACKHOLE_PATTERN = re.compile(r"blackhole", re.IGNORECASE)
+
+    def __init__(self) -> None:
+        # Raw sounddevice device list, shared by all queries (None = not yet queried)
+        self._devices: list[dict[str, Any]] | None = None
 
     def is_available(self) -> bool:
         """Check if Core Audio is available via sounddevice.
@@ -65,11 +69,17 @@ class CoreAudioBackend:
             if not is_macos():
                 return False
 
-            devices = sd.query_devices()
-            return len(devices) > 0
+            return len(self._query_devices()) > 0
         except Exception:
             return False
 
+    def invalidate_cache(self) -> None:
+        """Forget the queried devices so the next call asks Core Audio again.
+
+        Call this after audio devices have been added or removed.
+        """
+        self._devices = None
+
     def get_default_loopback(self) -> LoopbackDeviceInfo | None:
         """Get the default (first) BlackHole loopback device.
 
@@ -124,30 +134,32 @@ class CoreAudioBackend:
             List of LoopbackDeviceInfo for detected BlackHole devices,
             sorted alphabetically by name.
         """
-        devices = sd.query_devices()
-        blackhole_devices: list[LoopbackDeviceInfo] = []
-
-        for i, device in enumerate(devices):
-            device = cast(dict[str, Any], device)
-
-            # Skip output-only devices
-            if device["max_input_channels"] <= 0:
-                continue
-
-            name = str(device["name"])
-            if self._is_blackhole(name):
-                info = LoopbackDeviceInfo(
-                    name=name,
-                    device_id=i,
-                    channels=int(device["max_input_channels"]),
-                    sample_rate=float(device["default_samplerate"]),
-                )
-                blackhole_devices.append(info)
+        # Single pass: skip output-only devices, keep input-capable BlackHole ones
+        blackhole_devices = [
+            LoopbackDeviceInfo(
+                name=str(device["name"]),
+                device_id=i,
+                channels=int(device["max_input_channels"]),
+                sample_rate=float(device["default_samplerate"]),
+            )
+            for i, device in enumerate(self._query_devices())
+            if device["max_input_channels"] > 0 and self._is_blackhole(str(device["name"]))
+        ]
 
         # Sort alphabetically for stability
         blackhole_devices.sort(key=lambda x: x.name)
         return blackhole_devices
 
+    def _query_devices(self) -> list[dict[str, Any]]:
+        """Return the sounddevice device list, querying Core Audio on first use.
+
+        Returns:
+            List of sounddevice device dictionaries, indexed by device index.
+        """
+        if self._devices is None:
+            self._devices = [cast(dict[str, Any], device) for device in sd.query_devices()]
+        return self._devices
+
     def _is_blackhole(self, device_name: str) -> bool:
         """Check if device name indicates a BlackHole device.
 
@@ -157,4 +169,4 @@ class CoreAudioBackend:
         Returns:
             True if the device appears to be a BlackHole device.
         """
-        return bool(re.search(self._BLACKHOLE_PATTERN, device_name, re.IGNORECASE))
+        return self._BLACKHOLE_PATTERN.search(device_name) is not None
@@ -4,32 +4,27 @@ This backend uses the pulsectl library (libpulse ctypes bindings) to discover
 PulseAudio and PipeWire monitor sources (loopback devices).
 """
 
-from hark.audio_backends.base import LoopbackDeviceInfo, RecordingConfig
+import importlib.util
+
+from hark.audio_backends.base import LoopbackBackend, LoopbackDeviceInfo, RecordingConfig
 
 __all__ = ["PulseAudioBackend"]
 
-# Cached availability check to avoid repeated import attempts
-_PULSECTL_AVAILABLE: bool | None = None
+# Resolved once at import time. find_spec locates pulsectl without importing
+# it, so libpulse is only loaded once a backend method actually connects.
+_PULSECTL_AVAILABLE: bool = importlib.util.find_spec("pulsectl") is not None
 
 
 def _check_pulsectl_available() -> bool:
-    """Check if pulsectl is available (cached).
+    """Check if pulsectl is installed.
 
     Returns:
-        True if pulsectl can be imported, False otherwise.
+        True if pulsectl can be found on the import path, False otherwise.
     """
-    global _PULSECTL_AVAILABLE
-    if _PULSECTL_AVAILABLE is None:
-        try:
-            import pulsectl  # noqa: F401
-
-            _PULSECTL_AVAILABLE = True
-        except ImportError:
-            _PULSECTL_AVAILABLE = False
     return _PULSECTL_AVAILABLE
 
 
-class PulseAudioBackend:
+class PulseAudioBackend(LoopbackBackend):
     """PulseAudio/PipeWire loopback backend using pulsectl.
 
     Uses pulsectl (libpulse bindings) to discover monitor sources on Linux
@@ -42,10 +37,17 @@ class PulseAudioBackend:
     # Client name for PulseAudio connection
     _CLIENT_NAME = "hark"
 
+    # PulseAudio/PipeWire name each sink's monitor source "<sink>.monitor"
+    _MONITOR_SUFFIX = ".monitor"
+
     # Fallback values if source doesn't report them
     _DEFAULT_CHANNELS = 2
     _DEFAULT_SAMPLE_RATE = 44100.0
 
+    def __init__(self) -> None:
+        # Enumerated monitors, default sink's monitor first (None = not yet queried)
+        self._devices: list[LoopbackDeviceInfo] | None = None
+
     def is_available(self) -> bool:
         """Check if PulseAudio/PipeWire is available.
 
@@ -55,6 +57,10 @@ class PulseAudioBackend:
         if not _check_pulsectl_available():
             return False
 
+        # A cached enumeration already proved the server is reachable
+        if self._devices is not None:
+            return True
+
         try:
             import pulsectl
 
@@ -64,38 +70,23 @@ class PulseAudioBackend:
         except Exception:
             return False
 
+    def invalidate_cache(self) -> None:
+        """Forget the enumerated monitors so the next call queries PulseAudio again.
+
+        Call this after sinks have been added, removed, or the default sink changed.
+        """
+        self._devices = None
+
     def get_default_loopback(self) -> LoopbackDeviceInfo | None:
         """Get the default loopback device (monitor of default sink).
 
         Returns:
-            LoopbackDeviceInfo for the default sink's monitor, or None
-            if no PulseAudio/PipeWire monitors are available.
+            LoopbackDeviceInfo for the default sink's monitor, or the first
+            monitor if the default sink has none. None if no PulseAudio/PipeWire
+            monitors are available.
         """
-        if not _check_pulsectl_available():
-            return None
-
-        try:
-            import pulsectl
-
-            with pulsectl.Pulse(self._CLIENT_NAME) as pulse:
-                server_info = pulse.server_info()
-                default_sink = server_info.default_sink_name
-                default_monitor = f"{default_sink}.monitor" if default_sink else None
-
-                # Find the monitor source for the default sink
-                for source in pulse.source_list():
-                    if self._is_monitor(source) and source.name == default_monitor:
-                        return self._to_device_info(source)
-
-                # Fallback: return first monitor if no default match
-                for source in pulse.source_list():
-                    if self._is_monitor(source):
-                        return self._to_device_info(source)
-
-        except Exception:
-            pass
-
-        return None
+        devices = self._get_devices()
+        return devices[0] if devices else None
 
     def list_loopback_devices(self) -> list[LoopbackDeviceInfo]:
         """List all available PulseAudio/PipeWire monitor sources.
@@ -104,28 +95,49 @@ class PulseAudioBackend:
             List of LoopbackDeviceInfo for all discovered monitors,
             sorted with the default sink's monitor first.
         """
-        if not _check_pulsectl_available():
-            return []
+        return list(self._get_devices())
 
-        try:
-            import pulsectl
+    def _get_devices(self) -> list[LoopbackDeviceInfo]:
+        """Return the cached monitor list, enumerating it on first use.
 
-            with pulsectl.Pulse(self._CLIENT_NAME) as pulse:
-                server_info = pulse.server_info()
-                default_sink = server_info.default_sink_name
-                default_monitor = f"{default_sink}.monitor" if default_sink else None
+        Failed enumerations are not cached, so a later call can retry.
 
-                # Collect all monitor sources
-                monitors = [s for s in pulse.source_list() if self._is_monitor(s)]
+        Returns:
+            Monitors sorted with the default sink's monitor first.
+        """
+        if self._devices is None:
+            if not _check_pulsectl_available():
+                return []
 
-                # Sort with default monitor first
-                if default_monitor:
-                    monitors.sort(key=lambda s: 0 if s.name == default_monitor else 1)
+            try:
+                import pulsectl
 
-                return [self._to_device_info(s) for s in monitors]
+                with pulsectl.Pulse(self._CLIENT_NAME) as pulse:
+                    server_info = pulse.server_info()
+                    default_sink = server_info.default_sink_name
+                    default_monitor = (
+                        f"{default_sink}{self._MONITOR_SUFFIX}" if default_sink else None
+                    )
 
-        except Exception:
-            return []
+                    # Collect all monitor sources (source names are unique per server)
+                    monitors = {
+                        name: s
+                        for s in pulse.source_list()
+                        if (name := s.name).endswith(self._MONITOR_SUFFIX)
+                    }
+
+                    # Default monitor first, the rest in server order
+                    default = monitors.pop(default_monitor, None) if default_monitor else None
+                    ordered = list(monitors.values())
+                    if default is not None:
+                        ordered.insert(0, default)
+
+                    self._devices = list(map(self._to_device_info, ordered))
+
+            except Exception:
+                return []
+
+        return self._devices
 
     def get_recording_config(self, device_id: str | int | None) -> RecordingConfig:
         """Get configuration for recording from a PulseAudio monitor source.
@@ -145,17 +157,6 @@ class PulseAudioBackend:
             env["PULSE_SOURCE"] = str(device_id)
         return RecordingConfig(env=env, device="pulse")
 
-    def _is_monitor(self, source) -> bool:
-        """Check if a PulseAudio source is a monitor source.
-
-        Args:
-            source: A pulsectl PulseSourceInfo object.
-
-        Returns:
-            True if the source name contains ".monitor".
-        """
-        return ".monitor" in source.name
-
     def _to_device_info(self, source) -> LoopbackDeviceInfo:
         """Convert a pulsectl PulseSourceInfo to LoopbackDeviceInfo.
 
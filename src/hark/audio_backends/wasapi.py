@@ -5,9 +5,11 @@ This enables recording system audio on Windows 10+ without requiring
 virtual audio cables or Stereo Mix.
 """
 
+import contextlib
+import time
 from typing import Any
 
-from hark.audio_backends.base import LoopbackDeviceInfo, RecordingConfig
+from hark.audio_backends.base import LoopbackBackend, LoopbackDeviceInfo, RecordingConfig
 
 __all__ = ["WASAPIBackend"]
 
@@ -32,7 +34,7 @@ def _check_pyaudiowpatch_available() -> bool:
     return _PYAUDIOWPATCH_AVAILABLE
 
 
-class WASAPIBackend:
+class WASAPIBackend(LoopbackBackend):
     """WASAPI loopback backend using PyAudioWPatch.
 
     Uses PyAudioWPatch to discover and configure WASAPI loopback devices
@@ -48,24 +50,31 @@ class WASAPIBackend:
     _DEFAULT_CHANNELS = 2
     _DEFAULT_SAMPLE_RATE = 44100.0
 
+    # Seconds an enumeration stays valid. WASAPI enumeration goes through COM
+    # and is slow, but devices can be plugged in while hark is running.
+    _CACHE_TTL = 3.0
+
+    def __init__(self) -> None:
+        # (devices sorted default-first, default device) from the last enumeration
+        self._cache: tuple[list[LoopbackDeviceInfo], LoopbackDeviceInfo | None] | None = None
+        self._cache_time = 0.0
+
     def is_available(self) -> bool:
         """Check if WASAPI loopback is available.
 
         Returns:
             True if PyAudioWPatch can access WASAPI loopback devices.
         """
-        if not _check_pyaudiowpatch_available():
-            return False
+        _, default = self._get_devices()
+        return default is not None
 
-        try:
-            import pyaudiowpatch as pyaudio  # pyrefly: ignore[missing-import]
+    def invalidate_cache(self) -> None:
+        """Forget the enumerated devices so the next call asks WASAPI again.
 
-            with pyaudio.PyAudio() as p:
-                # Try to get default loopback - if this works, WASAPI is available
-                p.get_default_wasapi_loopback()
-            return True
-        except (OSError, Exception):
-            return False
+        Call this after audio devices have been added or removed, or the
+        default output changed, to avoid waiting for the cache to expire.
+        """
+        self._cache = None
 
     def get_default_loopback(self) -> LoopbackDeviceInfo | None:
         """Get the default WASAPI loopback device.
@@ -74,17 +83,8 @@ class WASAPIBackend:
             LoopbackDeviceInfo for the default loopback device, or None
             if no loopback device is available.
         """
-        if not _check_pyaudiowpatch_available():
-            return None
-
-        try:
-            import pyaudiowpatch as pyaudio  # pyrefly: ignore[missing-import]
-
-            with pyaudio.PyAudio() as p:
-                device = p.get_default_wasapi_loopback()
-                return self._to_device_info(device)
-        except (OSError, Exception):
-            return None
+        _, default = self._get_devices()
+        return default
 
     def list_loopback_devices(self) -> list[LoopbackDeviceInfo]:
         """List all available WASAPI loopback devices.
@@ -93,35 +93,8 @@ class WASAPIBackend:
             List of LoopbackDeviceInfo for all discovered loopback devices,
             sorted with the default loopback device first.
         """
-        if not _check_pyaudiowpatch_available():
-            return []
-
-        try:
-            import pyaudiowpatch as pyaudio  # pyrefly: ignore[missing-import]
-
-            devices: list[LoopbackDeviceInfo] = []
-            default_index: int | None = None
-
-            with pyaudio.PyAudio() as p:
-                # Get default loopback index for sorting
-                try:
-                    default_device = p.get_default_wasapi_loopback()
-                    default_index = default_device.get("index")
-                except (OSError, Exception):
-                    pass
-
-                # Collect all loopback devices
-                for device in p.get_loopback_device_info_generator():
-                    devices.append(self._to_device_info(device))
-
-            # Sort with default device first
-            if default_index is not None:
-                devices.sort(key=lambda d: 0 if d.device_id == default_index else 1)
-
-            return devices
-
-        except (OSError, Exception):
-            return []
+        devices, _ = self._get_devices()
+        return list(devices)
 
     def get_recording_config(self, device_id: str | int | None) -> RecordingConfig:
         """Get configuration for recording from a WASAPI loopback device.
@@ -142,6 +115,55 @@ class WASAPIBackend:
 
         return RecordingConfig(env={}, device=device_marker)
 
+    def _get_devices(self) -> tuple[list[LoopbackDeviceInfo], LoopbackDeviceInfo | None]:
+        """Return the cached enumeration, refreshing it once the TTL has expired.
+
+        Failed enumerations are not cached, so a later call can retry.
+
+        Returns:
+            Tuple of (loopback devices sorted default-first, default device or None).
+        """
+        now = time.monotonic()
+        if self._cache is None or now - self._cache_time >= self._CACHE_TTL:
+            if not _check_pyaudiowpatch_available():
+                return [], None
+
+            try:
+                self._cache = self._enumerate()
+            except (OSError, Exception):
+                return [], None
+            self._cache_time = now
+
+        return self._cache
+
+    def _enumerate(self) -> tuple[list[LoopbackDeviceInfo], LoopbackDeviceInfo | None]:
+        """Enumerate loopback devices and the default one within a single PyAudio session.
+
+        Returns:
+            Tuple of (loopback devices sorted default-first, default device or None).
+        """
+        import pyaudiowpatch as pyaudio  # pyrefly: ignore[missing-import]
+
+        default: LoopbackDeviceInfo | None = None
+
+        with pyaudio.PyAudio() as p:
+            # A missing default loopback still leaves the other devices usable
+            with contextlib.suppress(OSError, Exception):
+                default = self._to_device_info(p.get_default_wasapi_loopback())
+
+            # Likewise, a failing device walk must not hide the default device
+            try:
+                devices = [self._to_device_info(d) for d in p.get_loopback_device_info_generator()]
+            except (OSError, Exception):
+                devices = [default] if default is not None else []
+
+        # Sort with default device first
+        if default is not None:
+            default_index = default.device_id
+            devices.sort(key=lambda d: 0 if d.device_id == default_index else 1)
+
+        return devices, default
+
     def _to_device_info(self, device: dict[str, Any]) -> LoopbackDeviceInfo:
         """Convert a PyAudioWPatch device dict to LoopbackDeviceInfo.
 
@@ -20,6 +20,7 @@ __all__ = [
     "find_loopback_device",
     "list_loopback_devices",
     "get_devices_for_source",
+    "refresh_loopback_devices",
     "validate_source_availability",
 ]
 
@@ -53,6 +54,19 @@ def _get_loopback_backend() -> LoopbackBackend | None:
         return None
 
 
+def refresh_loopback_devices() -> None:
+    """
+    Make the next loopback lookup re-enumerate devices.
+
+    The loopback backend is created once per process and caches the devices
+    it finds; call this before resolving devices for a new recording so that
+    hot-plugged devices and default output changes are picked up.
+    """
+    backend = _get_loopback_backend()
+    if backend is not None:
+        backend.invalidate_cache()
+
+
 def _is_monitor_device(device_name: str) -> bool:
     """
     Check if device name indicates a monitor/loopback source.
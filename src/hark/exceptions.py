@@ -1,6 +1,6 @@
 """Custom exceptions for hark."""
 
-__all__ = [
+__all__ = (
     "HarkError",
     "ConfigError",
     "ConfigNotFoundError",
@@ -20,7 +20,7 @@ __all__ = [
     "DependencyMissingError",
     "MissingTokenError",
     "GatedModelError",
-]
+)
 
 
 class HarkError(Exception):
@@ -42,11 +42,42 @@ class ConfigNotFoundError(ConfigError):
 
 
 class ConfigValidationError(ConfigError):
-    """Configuration validation failed."""
+    """Configuration validation failed.
+
+    The message lists at most ``MAX_LISTED_ERRORS`` entries (and roughly
+    ``MAX_MESSAGE_CHARS`` characters); the full list is always in ``errors``.
+    """
+
+    MAX_LISTED_ERRORS = 20
+    MAX_MESSAGE_CHARS = 4096
 
     def __init__(self, errors: list[str]) -> None:
         self.errors = errors
-        super().__init__(f"Configuration validation failed: {'; '.join(errors)}")
+        self._msg: str | None = None
+        super().__init__()
+
+    def __str__(self) -> str:
+        # Formatted on first use; callers that only inspect .errors never pay for it.
+        if self._msg is None:
+            listed: list[str] = []
+            size = 0
+            for error in self.errors:
+                if len(listed) >= self.MAX_LISTED_ERRORS or size > self.MAX_MESSAGE_CHARS:
+                    break
+                listed.append(error)
+                size += len(error) + 2
+            remaining = len(self.errors) - len(listed)
+            if remaining:
+                listed.append(f"(+{remaining} more)")
+            self._msg = "Configuration validation failed: " + "; ".join(listed)
+        return self._msg
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.errors!r})"
+
+    def __reduce__(self) -> tuple[type, tuple[list[str]]]:
+        # args is empty (the message is lazy), so rebuild from errors for pickle/copy.
+        return (type(self), (self.errors,))
 
 
 class AudioError(HarkError):
@@ -121,9 +152,23 @@ class InsufficientDiskSpaceError(HarkError):
     def __init__(self, required_mb: float, available_mb: float) -> None:
         self.required_mb = required_mb
         self.available_mb = available_mb
-        super().__init__(
-            f"Insufficient disk space: need {required_mb:.0f}MB, have {available_mb:.0f}MB"
-        )
+        self._msg: str | None = None
+        super().__init__()
+
+    def __str__(self) -> str:
+        if self._msg is None:
+            self._msg = (
+                f"Insufficient disk space: need {self.required_mb:.0f}MB, "
+                f"have {self.available_mb:.0f}MB"
+            )
+        return self._msg
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.required_mb!r}, {self.available_mb!r})"
+
+    def __reduce__(self) -> tuple[type, tuple[float, float]]:
+        # args is empty (the message is lazy), so rebuild from the sizes for pickle/copy.
+        return (type(self), (self.required_mb, self.available_mb))
 
 
 class OutputError(HarkError):
@@ -1,7 +1,6 @@
 """Dual-stream audio interleaving for hark."""
 
 import threading
-import time
 
 import numpy as np
 
@@ -21,6 +20,13 @@ class DualStreamInterleaver:
     - Flushing remaining buffers on stop
     """
 
+    # Initial capacity of the reusable stereo output buffer, in frames
+    _INITIAL_OUTPUT_FRAMES = 4096
+
+    # Upper bound on an idle wait, so a stop signalled only through
+    # _stop_event (without notify) is still noticed
+    _IDLE_WAIT_SECONDS = 0.1
+
     def __init__(self, file_manager: RecordingFileManager) -> None:
         """
         Initialize the interleaver.
@@ -32,8 +38,12 @@ class DualStreamInterleaver:
         self._mic_buffer: list[np.ndarray] = []
         self._speaker_buffer: list[np.ndarray] = []
         self._lock = threading.Lock()
+        # Signalled when a mic/speaker chunk pair is ready or stop() is called
+        self._data_ready = threading.Condition(self._lock)
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
+        # Stereo scratch buffer reused for every write (guarded by _lock)
+        self._output = np.empty((self._INITIAL_OUTPUT_FRAMES, 2), dtype=np.float32)
 
     @property
     def mic_buffer(self) -> list[np.ndarray]:
@@ -49,21 +59,57 @@ class DualStreamInterleaver:
         """
         Add audio data to the mic buffer.
 
+        The data is copied (the callback buffer is reused by the stream) and
+        normalized to C-contiguous float32 in the same pass.
+
         Args:
-            data: Audio data as numpy array.
+            data: Floating-point audio data as numpy array.
+
+        Raises:
+            TypeError: If data is not floating point.
         """
-        with self._lock:
-            self._mic_buffer.append(data.copy())
+        chunk = self._to_float32(data)
+        with self._data_ready:
+            self._mic_buffer.append(chunk)
+            if self._speaker_buffer:
+                self._data_ready.notify()
 
     def add_speaker_data(self, data: np.ndarray) -> None:
         """
         Add audio data to the speaker buffer.
 
+        The data is copied and normalized like add_mic_data().
+
+        Args:
+            data: Floating-point audio data as numpy array.
+
+        Raises:
+            TypeError: If data is not floating point.
+        """
+        chunk = self._to_float32(data)
+        with self._data_ready:
+            self._speaker_buffer.append(chunk)
+            if self._mic_buffer:
+                self._data_ready.notify()
+
+    @staticmethod
+    def _to_float32(data: np.ndarray) -> np.ndarray:
+        """
+        Copy a chunk as C-contiguous float32.
+
         Args:
-            data: Audio data as numpy array.
+            data: Floating-point audio data as numpy array.
+
+        Returns:
+            A new float32 array with the same samples.
+
+        Raises:
+            TypeError: If data is not floating point. Integer PCM would need
+                scaling to [-1, 1], which a plain cast does not do.
         """
-        with self._lock:
-            self._speaker_buffer.append(data.copy())
+        if not np.issubdtype(data.dtype, np.floating):
+            raise TypeError(f"Expected floating-point audio data, got {data.dtype}")
+        return np.array(data, dtype=np.float32, order="C")
 
     def start(self) -> None:
         """Start the interleaving thread."""
@@ -79,7 +125,9 @@ class DualStreamInterleaver:
     def stop(self) -> None:
         """Stop the interleaving thread and flush remaining buffers."""
         if self._thread is not None:
-            self._stop_event.set()
+            with self._data_ready:
+                self._stop_event.set()
+                self._data_ready.notify_all()
             self._thread.join(timeout=1.0)
             self._thread = None
 
@@ -89,56 +137,80 @@ class DualStreamInterleaver:
     def _interleave_loop(self) -> None:
         """Thread loop that interleaves mic and speaker buffers."""
         while not self._stop_event.is_set():
+            # Sleep until a chunk pair is ready instead of polling
+            with self._data_ready:
+                self._data_ready.wait_for(self._has_work, timeout=self._IDLE_WAIT_SECONDS)
             self._process_buffers()
-            # Prevent busy-waiting
-            time.sleep(0.01)
+
+    def _has_work(self) -> bool:
+        """Check whether the loop should wake (called with _lock held)."""
+        return self._stop_event.is_set() or bool(self._mic_buffer and self._speaker_buffer)
 
     def _process_buffers(self) -> None:
         """Process available buffer pairs and write to file."""
         with self._lock:
             min_chunks = min(len(self._mic_buffer), len(self._speaker_buffer))
+            if min_chunks == 0:
+                return
 
-            for _ in range(min_chunks):
-                mic_chunk = self._mic_buffer.pop(0)
-                speaker_chunk = self._speaker_buffer.pop(0)
-
-                # Ensure same length (take minimum)
-                min_len = min(len(mic_chunk), len(speaker_chunk))
-                mic_chunk = mic_chunk[:min_len]
-                speaker_chunk = speaker_chunk[:min_len]
-
-                # Interleave: L=mic, R=speaker
-                stereo = np.column_stack(
-                    [
-                        mic_chunk.flatten(),
-                        speaker_chunk.flatten(),
-                    ]
-                )
+            # Detach all matched pairs at once; pop(0) per chunk shifts the whole list
+            mic_chunks = self._mic_buffer[:min_chunks]
+            speaker_chunks = self._speaker_buffer[:min_chunks]
+            del self._mic_buffer[:min_chunks]
+            del self._speaker_buffer[:min_chunks]
 
-                self._file_manager.write(stereo)
+            # One write per tick rather than one libsndfile call per chunk pair
+            self._file_manager.write(self._interleave(mic_chunks, speaker_chunks))
 
     def _flush_remaining(self) -> None:
         """Flush any remaining matched buffer pairs."""
         with self._lock:
             min_chunks = min(len(self._mic_buffer), len(self._speaker_buffer))
-
-            for _ in range(min_chunks):
-                mic_chunk = self._mic_buffer.pop(0)
-                speaker_chunk = self._speaker_buffer.pop(0)
-
-                min_len = min(len(mic_chunk), len(speaker_chunk))
-                mic_chunk = mic_chunk[:min_len]
-                speaker_chunk = speaker_chunk[:min_len]
-
-                stereo = np.column_stack(
-                    [
-                        mic_chunk.flatten(),
-                        speaker_chunk.flatten(),
-                    ]
+            if min_chunks > 0:
+                self._file_manager.write(
+                    self._interleave(
+                        self._mic_buffer[:min_chunks], self._speaker_buffer[:min_chunks]
+                    )
                 )
 
-                self._file_manager.write(stereo)
-
             # Clear any remaining unmatched buffers
             self._mic_buffer.clear()
             self._speaker_buffer.clear()
+
+    def _interleave(
+        self, mic_chunks: list[np.ndarray], speaker_chunks: list[np.ndarray]
+    ) -> np.ndarray:
+        """
+        Interleave matched mono chunk pairs into the reusable stereo buffer.
+
+        Must be called with _lock held. The returned view is overwritten by
+        the next call, so it has to be written out before then.
+
+        Args:
+            mic_chunks: Mono mic chunks, written to the left channel.
+            speaker_chunks: Mono speaker chunks, written to the right channel.
+
+        Returns:
+            Stereo view of shape (frames, 2) with the pairs laid out back to
+            back, each truncated to its shorter chunk.
+        """
+        # Ensure same length per pair (take minimum)
+        lengths = [
+            min(len(mic_chunk), len(speaker_chunk))
+            for mic_chunk, speaker_chunk in zip(mic_chunks, speaker_chunks, strict=True)
+        ]
+        total = sum(lengths)
+        if total > len(self._output):
+            self._output = np.empty((total, 2), dtype=np.float32)
+
+        # Interleave: L=mic, R=speaker
+        stereo = self._output[:total]
+        start = 0
+        for mic_chunk, speaker_chunk, length in zip(
+            mic_chunks, speaker_chunks, lengths, strict=True
+        ):
+            end = start + length
+            stereo[start:end, 0] = mic_chunk[:length].reshape(-1)
+            stereo[start:end, 1] = speaker_chunk[:length].reshape(-1)
+            start = end
+        return stereo
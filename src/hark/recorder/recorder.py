@@ -15,6 +15,7 @@ from hark.audio_sources import (
     AudioSourceInfo,
     InputSource,
     get_devices_for_source,
+    refresh_loopback_devices,
     validate_source_availability,
 )
 from hark.constants import (
@@ -235,6 +236,11 @@ class AudioRecorder:
         if self._is_recording:
             return
 
+        # Re-enumerate loopback devices once per recording; validation and
+        # device lookup below then share that enumeration
+        if self._input_source in (InputSource.SPEAKER, InputSource.BOTH):
+            refresh_loopback_devices()
+
         # Validate source availability
         errors = validate_source_availability(self._input_source)
         if errors:
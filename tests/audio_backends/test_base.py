@@ -1,8 +1,12 @@
 """Tests for audio_backends base module - protocol, dataclasses, exports."""
 
+from dataclasses import FrozenInstanceError
 from unittest.mock import patch
 
+import pytest
+
 from hark.audio_backends import LoopbackBackend, LoopbackDeviceInfo, RecordingConfig
+from hark.audio_backends.base import _PROTOCOL_MEMBERS
 from hark.audio_backends.coreaudio import CoreAudioBackend
 from hark.audio_backends.pulseaudio import PulseAudioBackend
 from hark.audio_backends.wasapi import WASAPIBackend
@@ -11,25 +15,20 @@ from hark.audio_backends.wasapi import WASAPIBackend
 class TestRecordingConfig:
     """Tests for RecordingConfig dataclass."""
 
-    def test_create_with_env_and_device(self) -> None:
-        """Should create with environment variables and device."""
-        config = RecordingConfig(
-            env={"PULSE_SOURCE": "monitor.source"},
-            device="pulse",
-        )
-        assert config.env == {"PULSE_SOURCE": "monitor.source"}
-        assert config.device == "pulse"
-
-    def test_create_with_empty_env(self) -> None:
-        """Should create with empty environment (Windows/macOS style)."""
-        config = RecordingConfig(env={}, device=5)
-        assert config.env == {}
-        assert config.device == 5
-
-    def test_create_with_none_device(self) -> None:
-        """Should create with None device."""
-        config = RecordingConfig(env={}, device=None)
-        assert config.device is None
+    @pytest.mark.parametrize(
+        ("env", "device"),
+        [
+            ({"PULSE_SOURCE": "monitor.source"}, "pulse"),
+            ({}, 5),
+            ({}, None),
+        ],
+        ids=["pulse_env", "empty_env_int_device", "none_device"],
+    )
+    def test_create(self, env: dict[str, str], device: int | str | None) -> None:
+        """Should store env vars and device as given (Linux, Windows/macOS, fallback)."""
+        config = RecordingConfig(env=env, device=device)
+        assert config.env == env
+        assert config.device == device
 
     def test_equality(self) -> None:
         """Two RecordingConfig with same values should be equal."""
@@ -43,45 +42,41 @@ class TestRecordingConfig:
         config2 = RecordingConfig(env={"KEY": "val2"}, device="pulse")
         assert config1 != config2
 
+    def test_is_frozen(self) -> None:
+        """RecordingConfig fields should not be reassignable."""
+        config = RecordingConfig(env={}, device="pulse")
+        with pytest.raises(FrozenInstanceError):
+            config.device = 3  # type: ignore[misc]
+
 
 class TestLoopbackDeviceInfo:
     """Tests for LoopbackDeviceInfo dataclass."""
 
-    def test_create_with_string_device_id(self) -> None:
-        """Should create with string device ID (Linux PulseAudio style)."""
+    @pytest.mark.parametrize(
+        ("name", "device_id", "sample_rate"),
+        [
+            (
+                "Monitor of Built-in Audio",
+                "alsa_output.pci-0000_00_1f.3.analog-stereo.monitor",
+                44100.0,
+            ),
+            ("Speakers (Realtek Audio)", 5, 48000.0),
+            ("BlackHole 2ch", None, 44100.0),
+        ],
+        ids=["pulseaudio_source_name", "wasapi_index", "no_device_id"],
+    )
+    def test_create(self, name: str, device_id: str | int | None, sample_rate: float) -> None:
+        """Should store string, integer, or missing device IDs as given."""
         info = LoopbackDeviceInfo(
-            name="Monitor of Built-in Audio",
-            device_id="alsa_output.pci-0000_00_1f.3.analog-stereo.monitor",
+            name=name,
+            device_id=device_id,
             channels=2,
-            sample_rate=44100.0,
+            sample_rate=sample_rate,
         )
-        assert info.name == "Monitor of Built-in Audio"
-        assert info.device_id == "alsa_output.pci-0000_00_1f.3.analog-stereo.monitor"
+        assert info.name == name
+        assert info.device_id == device_id
         assert info.channels == 2
-        assert info.sample_rate == 44100.0
-
-    def test_create_with_int_device_id(self) -> None:
-        """Should create with integer device ID (Windows WASAPI style)."""
-        info = LoopbackDeviceInfo(
-            name="Speakers (Realtek Audio)",
-            device_id=5,
-            channels=2,
-            sample_rate=48000.0,
-        )
-        assert info.name == "Speakers (Realtek Audio)"
-        assert info.device_id == 5
-        assert info.channels == 2
-        assert info.sample_rate == 48000.0
-
-    def test_create_with_none_device_id(self) -> None:
-        """Should create with None device ID (fallback/virtual devices)."""
-        info = LoopbackDeviceInfo(
-            name="BlackHole 2ch",
-            device_id=None,
-            channels=2,
-            sample_rate=44100.0,
-        )
-        assert info.device_id is None
+        assert info.sample_rate == sample_rate
 
     def test_equality(self) -> None:
         """Two LoopbackDeviceInfo with same values should be equal."""
@@ -95,6 +90,14 @@ class TestLoopbackDeviceInfo:
         info2 = LoopbackDeviceInfo(name="Test2", device_id="test", channels=2, sample_rate=44100.0)
         assert info1 != info2
 
+    def test_is_frozen_and_hashable(self) -> None:
+        """LoopbackDeviceInfo should be immutable and usable as a dict key."""
+        info = LoopbackDeviceInfo(name="Test", device_id="test", channels=2, sample_rate=44100.0)
+        with pytest.raises(FrozenInstanceError):
+            info.name = "Other"  # type: ignore[misc]
+        assert {info: True}[info]
+        assert not hasattr(info, "__dict__")
+
 
 class TestLoopbackBackendProtocol:
     """Tests for LoopbackBackend protocol."""
@@ -115,6 +118,9 @@ class TestLoopbackBackendProtocol:
             def get_recording_config(self, device_id: str | int | None) -> RecordingConfig:
                 return RecordingConfig(env={}, device=device_id)
 
+            def invalidate_cache(self) -> None:
+                pass
+
         backend = MockBackend()
         assert isinstance(backend, LoopbackBackend)
 
@@ -130,6 +136,71 @@ class TestLoopbackBackendProtocol:
         backend = IncompleteBackend()
         assert not isinstance(backend, LoopbackBackend)
 
+    def test_bundled_backends_subclass_protocol(self) -> None:
+        """Bundled backends should inherit from the protocol explicitly."""
+        for backend_cls in (PulseAudioBackend, CoreAudioBackend, WASAPIBackend):
+            assert LoopbackBackend in backend_cls.__mro__
+
+    def test_nominal_subclass_skips_structural_check(self) -> None:
+        """Explicit subclasses should match on the MRO alone."""
+        backend = PulseAudioBackend()
+        backend.is_available = None  # type: ignore[assignment]
+        assert isinstance(backend, LoopbackBackend)
+
+    def test_protocol_members_collected_once(self) -> None:
+        """Protocol members should be precomputed outside the protocol namespace."""
+        assert "_protocol_members" not in LoopbackBackend.__dict__
+        assert _PROTOCOL_MEMBERS[LoopbackBackend] == {
+            "get_default_loopback",
+            "list_loopback_devices",
+            "is_available",
+            "invalidate_cache",
+            "get_recording_config",
+        }
+
+    def test_issubclass_supported(self) -> None:
+        """issubclass() should work for bundled and duck-typed backends."""
+
+        class DuckBackend:
+            def get_default_loopback(self) -> LoopbackDeviceInfo | None:
+                return None
+
+            def list_loopback_devices(self) -> list[LoopbackDeviceInfo]:
+                return []
+
+            def is_available(self) -> bool:
+                return True
+
+            def get_recording_config(self, device_id: str | int | None) -> RecordingConfig:
+                return RecordingConfig(env={}, device=device_id)
+
+            def invalidate_cache(self) -> None:
+                pass
+
+        assert issubclass(PulseAudioBackend, LoopbackBackend)
+        assert issubclass(DuckBackend, LoopbackBackend)
+        assert not issubclass(LoopbackDeviceInfo, LoopbackBackend)
+
+    def test_protocol_rejects_none_member(self) -> None:
+        """A protocol method set to None should not satisfy the protocol."""
+
+        class DisabledBackend:
+            get_default_loopback = None
+
+            def list_loopback_devices(self) -> list[LoopbackDeviceInfo]:
+                return []
+
+            def is_available(self) -> bool:
+                return True
+
+            def get_recording_config(self, device_id: str | int | None) -> RecordingConfig:
+                return RecordingConfig(env={}, device=device_id)
+
+            def invalidate_cache(self) -> None:
+                pass
+
+        assert not isinstance(DisabledBackend(), LoopbackBackend)
+
     def test_mock_backend_functionality(self) -> None:
         """Test a mock backend implementing the protocol."""
 
@@ -149,6 +220,9 @@ class TestLoopbackBackendProtocol:
             def get_recording_config(self, device_id: str | int | None) -> RecordingConfig:
                 return RecordingConfig(env={}, device=device_id)
 
+            def invalidate_cache(self) -> None:
+                pass
+
         devices = [
             LoopbackDeviceInfo(name="Device 1", device_id="dev1", channels=2, sample_rate=44100.0),
             LoopbackDeviceInfo(name="Device 2", device_id="dev2", channels=2, sample_rate=48000.0),
@@ -177,6 +251,9 @@ class TestLoopbackBackendProtocol:
             def get_recording_config(self, device_id: str | int | None) -> RecordingConfig:
                 return RecordingConfig(env={}, device=device_id)
 
+            def invalidate_cache(self) -> None:
+                pass
+
         backend = MockBackend()
 
         assert isinstance(backend, LoopbackBackend)
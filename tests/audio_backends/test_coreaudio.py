@@ -27,53 +27,60 @@ def _create_mock_sd_device(
     }
 
 
+@pytest.fixture
+def backend() -> CoreAudioBackend:
+    """Create a CoreAudio backend under test."""
+    return CoreAudioBackend()
+
+
 class TestCoreAudioBackend:
     """Tests for CoreAudioBackend implementation."""
 
-    def test_implements_loopback_backend(self) -> None:
+    def test_implements_loopback_backend(self, backend: CoreAudioBackend) -> None:
         """CoreAudioBackend should implement LoopbackBackend protocol."""
-        backend = CoreAudioBackend()
         assert isinstance(backend, LoopbackBackend)
 
     @patch("hark.audio_backends.coreaudio.is_macos", return_value=True)
     @patch("hark.audio_backends.coreaudio._check_sounddevice_available", return_value=True)
     @patch("hark.audio_backends.coreaudio.sd.query_devices")
-    def test_is_available_success(self, mock_query: MagicMock, _: MagicMock, __: MagicMock) -> None:
+    def test_is_available_success(
+        self, mock_query: MagicMock, _: MagicMock, __: MagicMock, backend: CoreAudioBackend
+    ) -> None:
         """Should return True on macOS with sounddevice working."""
         mock_query.return_value = [
             _create_mock_sd_device("Built-in Microphone"),
         ]
 
-        backend = CoreAudioBackend()
         assert backend.is_available() is True
 
     @patch("hark.audio_backends.coreaudio._check_sounddevice_available", return_value=False)
-    def test_is_available_sounddevice_unavailable(self, _: MagicMock) -> None:
+    def test_is_available_sounddevice_unavailable(
+        self, _: MagicMock, backend: CoreAudioBackend
+    ) -> None:
         """Should return False when sounddevice unavailable."""
-        backend = CoreAudioBackend()
         assert backend.is_available() is False
 
     @patch("hark.audio_backends.coreaudio.is_macos", return_value=False)
     @patch("hark.audio_backends.coreaudio._check_sounddevice_available", return_value=True)
     @patch("hark.audio_backends.coreaudio.sd.query_devices")
     def test_is_available_wrong_platform(
-        self, mock_query: MagicMock, _: MagicMock, __: MagicMock
+        self, mock_query: MagicMock, _: MagicMock, __: MagicMock, backend: CoreAudioBackend
     ) -> None:
         """Should return False on non-macOS platforms."""
         mock_query.return_value = []
-        backend = CoreAudioBackend()
         assert backend.is_available() is False
 
     @patch("hark.audio_backends.coreaudio._check_sounddevice_available", return_value=True)
     @patch("hark.audio_backends.coreaudio.sd.query_devices")
-    def test_get_default_loopback_blackhole_2ch(self, mock_query: MagicMock, _: MagicMock) -> None:
+    def test_get_default_loopback_blackhole_2ch(
+        self, mock_query: MagicMock, _: MagicMock, backend: CoreAudioBackend
+    ) -> None:
         """Should detect BlackHole 2ch as default loopback."""
         mock_query.return_value = [
             _create_mock_sd_device("Built-in Microphone", max_input_channels=2),
             _create_mock_sd_device("BlackHole 2ch", max_input_channels=2),
         ]
 
-        backend = CoreAudioBackend()
         device = backend.get_default_loopback()
 
         assert device is not None
@@ -84,7 +91,9 @@ class TestCoreAudioBackend:
 
     @patch("hark.audio_backends.coreaudio._check_sounddevice_available", return_value=True)
     @patch("hark.audio_backends.coreaudio.sd.query_devices")
-    def test_get_default_loopback_blackhole_16ch(self, mock_query: MagicMock, _: MagicMock) -> None:
+    def test_get_default_loopback_blackhole_16ch(
+        self, mock_query: MagicMock, _: MagicMock, backend: CoreAudioBackend
+    ) -> None:
         """Should detect BlackHole 16ch."""
         mock_query.return_value = [
             _create_mock_sd_device(
@@ -92,7 +101,6 @@ class TestCoreAudioBackend:
             ),
         ]
 
-        backend = CoreAudioBackend()
         device = backend.get_default_loopback()
 
         assert device is not None
@@ -101,27 +109,29 @@ class TestCoreAudioBackend:
 
     @patch("hark.audio_backends.coreaudio._check_sounddevice_available", return_value=True)
     @patch("hark.audio_backends.coreaudio.sd.query_devices")
-    def test_get_default_loopback_none_found(self, mock_query: MagicMock, _: MagicMock) -> None:
+    def test_get_default_loopback_none_found(
+        self, mock_query: MagicMock, _: MagicMock, backend: CoreAudioBackend
+    ) -> None:
         """Should return None when no BlackHole devices found."""
         mock_query.return_value = [
             _create_mock_sd_device("Built-in Microphone", max_input_channels=2),
             _create_mock_sd_device("USB Audio Device", max_input_channels=2),
         ]
 
-        backend = CoreAudioBackend()
         device = backend.get_default_loopback()
         assert device is None
 
     @patch("hark.audio_backends.coreaudio._check_sounddevice_available", return_value=False)
-    def test_get_default_loopback_unavailable(self, _: MagicMock) -> None:
+    def test_get_default_loopback_unavailable(
+        self, _: MagicMock, backend: CoreAudioBackend
+    ) -> None:
         """Should return None when sounddevice unavailable."""
-        backend = CoreAudioBackend()
         assert backend.get_default_loopback() is None
 
     @patch("hark.audio_backends.coreaudio._check_sounddevice_available", return_value=True)
     @patch("hark.audio_backends.coreaudio.sd.query_devices")
     def test_list_loopback_devices_multiple_blackhole(
-        self, mock_query: MagicMock, _: MagicMock
+        self, mock_query: MagicMock, _: MagicMock, backend: CoreAudioBackend
     ) -> None:
         """Should list all BlackHole devices sorted alphabetically."""
         mock_query.return_value = [
@@ -130,7 +140,6 @@ class TestCoreAudioBackend:
             _create_mock_sd_device("BlackHole 2ch", max_input_channels=2),
         ]
 
-        backend = CoreAudioBackend()
         devices = backend.list_loopback_devices()
 
         assert len(devices) == 2
@@ -141,27 +150,29 @@ class TestCoreAudioBackend:
     @patch("hark.audio_backends.coreaudio._check_sounddevice_available", return_value=True)
     @patch("hark.audio_backends.coreaudio.sd.query_devices")
     def test_list_loopback_devices_empty_when_no_blackhole(
-        self, mock_query: MagicMock, _: MagicMock
+        self, mock_query: MagicMock, _: MagicMock, backend: CoreAudioBackend
     ) -> None:
         """Should return empty list when no BlackHole devices."""
         mock_query.return_value = [
             _create_mock_sd_device("Built-in Microphone", max_input_channels=2),
         ]
 
-        backend = CoreAudioBackend()
         devices = backend.list_loopback_devices()
         assert devices == []
 
     @patch("hark.audio_backends.coreaudio._check_sounddevice_available", return_value=False)
-    def test_list_loopback_devices_unavailable(self, _: MagicMock) -> None:
+    def test_list_loopback_devices_unavailable(
+        self, _: MagicMock, backend: CoreAudioBackend
+    ) -> None:
         """Should return empty list when sounddevice unavailable."""
-        backend = CoreAudioBackend()
         devices = backend.list_loopback_devices()
         assert devices == []
 
     @patch("hark.audio_backends.coreaudio._check_sounddevice_available", return_value=True)
     @patch("hark.audio_backends.coreaudio.sd.query_devices")
-    def test_skips_output_only_devices(self, mock_query: MagicMock, _: MagicMock) -> None:
+    def test_skips_output_only_devices(
+        self, mock_query: MagicMock, _: MagicMock, backend: CoreAudioBackend
+    ) -> None:
         """Should skip devices with no input channels."""
         mock_query.return_value = [
             _create_mock_sd_device(
@@ -176,55 +187,77 @@ class TestCoreAudioBackend:
             ),
         ]
 
-        backend = CoreAudioBackend()
         devices = backend.list_loopback_devices()
 
         assert len(devices) == 1
         assert devices[0].name == "BlackHole 16ch"
 
-    def test_get_recording_config_with_int_device_id(self) -> None:
+    @patch("hark.audio_backends.coreaudio.is_macos", return_value=True)
+    @patch("hark.audio_backends.coreaudio._check_sounddevice_available", return_value=True)
+    @patch("hark.audio_backends.coreaudio.sd.query_devices")
+    def test_queries_devices_once_per_instance(
+        self, mock_query: MagicMock, _: MagicMock, __: MagicMock, backend: CoreAudioBackend
+    ) -> None:
+        """is_available, default lookup and listing should share one device query."""
+        mock_query.return_value = [_create_mock_sd_device("BlackHole 2ch")]
+
+        assert backend.is_available() is True
+        assert backend.get_default_loopback() is not None
+        assert len(backend.list_loopback_devices()) == 1
+        assert mock_query.call_count == 1
+
+    @patch("hark.audio_backends.coreaudio._check_sounddevice_available", return_value=True)
+    @patch("hark.audio_backends.coreaudio.sd.query_devices")
+    def test_invalidate_cache_forces_requery(
+        self, mock_query: MagicMock, _: MagicMock, backend: CoreAudioBackend
+    ) -> None:
+        """invalidate_cache() should make the next call query Core Audio again."""
+        mock_query.return_value = [_create_mock_sd_device("BlackHole 2ch")]
+        assert len(backend.list_loopback_devices()) == 1
+
+        mock_query.return_value = []
+        assert len(backend.list_loopback_devices()) == 1
+
+        backend.invalidate_cache()
+        assert backend.list_loopback_devices() == []
+
+    def test_get_recording_config_with_int_device_id(self, backend: CoreAudioBackend) -> None:
         """Should return RecordingConfig with empty env and device index."""
-        backend = CoreAudioBackend()
         config = backend.get_recording_config(5)
 
         assert config.env == {}
         assert config.device == 5
 
-    def test_get_recording_config_with_none_device_id(self) -> None:
+    def test_get_recording_config_with_none_device_id(self, backend: CoreAudioBackend) -> None:
         """Should return RecordingConfig with None device when device_id is None."""
-        backend = CoreAudioBackend()
         config = backend.get_recording_config(None)
 
         assert config.env == {}
         assert config.device is None
 
-    def test_get_recording_config_with_string_device_id(self) -> None:
+    def test_get_recording_config_with_string_device_id(self, backend: CoreAudioBackend) -> None:
         """Should return None device for non-integer device_id."""
-        backend = CoreAudioBackend()
         config = backend.get_recording_config("some_string")
 
         assert config.env == {}
         assert config.device is None
 
-    def test_is_blackhole_case_insensitive(self) -> None:
+    def test_is_blackhole_case_insensitive(self, backend: CoreAudioBackend) -> None:
         """Device detection should be case-insensitive."""
-        backend = CoreAudioBackend()
         assert backend._is_blackhole("BLACKHOLE 2CH") is True
         assert backend._is_blackhole("BlackHole 2ch") is True
         assert backend._is_blackhole("blackhole 2ch") is True
         assert backend._is_blackhole("Blackhole16ch") is True
 
-    def test_is_blackhole_variants(self) -> None:
+    def test_is_blackhole_variants(self, backend: CoreAudioBackend) -> None:
         """Should detect all BlackHole channel variants."""
-        backend = CoreAudioBackend()
         assert backend._is_blackhole("BlackHole 2ch") is True
         assert backend._is_blackhole("BlackHole 16ch") is True
         assert backend._is_blackhole("BlackHole 64ch") is True
         assert backend._is_blackhole("BlackHole") is True
 
-    def test_is_blackhole_non_blackhole_devices_rejected(self) -> None:
+    def test_is_blackhole_non_blackhole_devices_rejected(self, backend: CoreAudioBackend) -> None:
         """Should not detect regular audio devices as BlackHole."""
-        backend = CoreAudioBackend()
         assert backend._is_blackhole("Built-in Microphone") is False
         assert backend._is_blackhole("MacBook Pro Microphone") is False
         assert backend._is_blackhole("USB Audio Device") is False
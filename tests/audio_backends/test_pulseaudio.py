@@ -1,6 +1,7 @@
 """Tests for PulseAudio backend - Linux only."""
 
 import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -17,65 +18,72 @@ def _create_mock_source(
     description: str | None = None,
     channel_count: int = 2,
     sample_rate: int = 48000,
-) -> MagicMock:
-    """Create a mock PulseSourceInfo object."""
-    source = MagicMock()
-    source.name = name
-    source.description = description
-    source.channel_count = channel_count
-    source.sample_spec = MagicMock()
-    source.sample_spec.rate = sample_rate
-    return source
+) -> SimpleNamespace:
+    """Create a stand-in PulseSourceInfo object."""
+    return SimpleNamespace(
+        name=name,
+        description=description,
+        channel_count=channel_count,
+        sample_spec=SimpleNamespace(rate=sample_rate),
+    )
 
 
-def _create_mock_server_info(default_sink: str | None = None) -> MagicMock:
-    """Create a mock PulseServerInfo object."""
-    info = MagicMock()
-    info.default_sink_name = default_sink
-    return info
+def _create_mock_server_info(default_sink: str | None = None) -> SimpleNamespace:
+    """Create a stand-in PulseServerInfo object."""
+    return SimpleNamespace(default_sink_name=default_sink)
+
+
+@pytest.fixture
+def mock_pulse(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Make pulsectl available and return the connected Pulse client mock."""
+    pulse = MagicMock()
+    pulse_class = MagicMock()
+    pulse_class.return_value.__enter__.return_value = pulse
+    monkeypatch.setattr("hark.audio_backends.pulseaudio._check_pulsectl_available", lambda: True)
+    monkeypatch.setattr("pulsectl.Pulse", pulse_class)
+    return pulse
+
+
+@pytest.fixture
+def backend() -> PulseAudioBackend:
+    """Create a PulseAudio backend under test."""
+    return PulseAudioBackend()
 
 
 class TestPulseAudioBackend:
     """Tests for PulseAudioBackend implementation."""
 
-    def test_implements_loopback_backend(self) -> None:
+    def test_implements_loopback_backend(self, backend: PulseAudioBackend) -> None:
         """PulseAudioBackend should implement LoopbackBackend protocol."""
-        backend = PulseAudioBackend()
         assert isinstance(backend, LoopbackBackend)
 
-    @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=True)
-    @patch("pulsectl.Pulse")
-    def test_is_available_success(self, mock_pulse_class: MagicMock, _: MagicMock) -> None:
+    def test_is_available_success(self, mock_pulse: MagicMock, backend: PulseAudioBackend) -> None:
         """Should return True when pulsectl connects successfully."""
-        mock_pulse = MagicMock()
-        mock_pulse_class.return_value.__enter__.return_value = mock_pulse
         mock_pulse.server_info.return_value = _create_mock_server_info()
 
-        backend = PulseAudioBackend()
         assert backend.is_available() is True
 
     @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=True)
     @patch("pulsectl.Pulse")
-    def test_is_available_connection_fails(self, mock_pulse_class: MagicMock, _: MagicMock) -> None:
+    def test_is_available_connection_fails(
+        self, mock_pulse_class: MagicMock, _: MagicMock, backend: PulseAudioBackend
+    ) -> None:
         """Should return False when PulseAudio connection fails."""
         mock_pulse_class.return_value.__enter__.side_effect = Exception("Connection refused")
 
-        backend = PulseAudioBackend()
         assert backend.is_available() is False
 
     @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=False)
-    def test_is_available_pulsectl_not_installed(self, _: MagicMock) -> None:
+    def test_is_available_pulsectl_not_installed(
+        self, _: MagicMock, backend: PulseAudioBackend
+    ) -> None:
         """Should return False when pulsectl is not installed."""
-        backend = PulseAudioBackend()
         assert backend.is_available() is False
 
-    @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=True)
-    @patch("pulsectl.Pulse")
-    def test_get_default_loopback_success(self, mock_pulse_class: MagicMock, _: MagicMock) -> None:
+    def test_get_default_loopback_success(
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
+    ) -> None:
         """Should return monitor device info when available."""
-        mock_pulse = MagicMock()
-        mock_pulse_class.return_value.__enter__.return_value = mock_pulse
-
         mock_pulse.server_info.return_value = _create_mock_server_info(
             default_sink="alsa_output.pci.analog-stereo"
         )
@@ -92,7 +100,6 @@ class TestPulseAudioBackend:
             ),
         ]
 
-        backend = PulseAudioBackend()
         device = backend.get_default_loopback()
 
         assert device is not None
@@ -101,15 +108,10 @@ class TestPulseAudioBackend:
         assert device.channels == 2
         assert device.sample_rate == 48000.0
 
-    @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=True)
-    @patch("pulsectl.Pulse")
     def test_get_default_loopback_no_monitors(
-        self, mock_pulse_class: MagicMock, _: MagicMock
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
     ) -> None:
         """Should return None when no monitors are available."""
-        mock_pulse = MagicMock()
-        mock_pulse_class.return_value.__enter__.return_value = mock_pulse
-
         mock_pulse.server_info.return_value = _create_mock_server_info()
         mock_pulse.source_list.return_value = [
             _create_mock_source(
@@ -118,26 +120,21 @@ class TestPulseAudioBackend:
             ),
         ]
 
-        backend = PulseAudioBackend()
         device = backend.get_default_loopback()
         assert device is None
 
     @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=False)
-    def test_get_default_loopback_pulsectl_unavailable(self, _: MagicMock) -> None:
+    def test_get_default_loopback_pulsectl_unavailable(
+        self, _: MagicMock, backend: PulseAudioBackend
+    ) -> None:
         """Should return None when pulsectl is not available."""
-        backend = PulseAudioBackend()
         device = backend.get_default_loopback()
         assert device is None
 
-    @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=True)
-    @patch("pulsectl.Pulse")
     def test_get_default_loopback_falls_back_to_first_monitor(
-        self, mock_pulse_class: MagicMock, _: MagicMock
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
     ) -> None:
         """Should fall back to first monitor if default sink's monitor not found."""
-        mock_pulse = MagicMock()
-        mock_pulse_class.return_value.__enter__.return_value = mock_pulse
-
         mock_pulse.server_info.return_value = _create_mock_server_info(
             default_sink="nonexistent_sink"
         )
@@ -148,19 +145,15 @@ class TestPulseAudioBackend:
             ),
         ]
 
-        backend = PulseAudioBackend()
         device = backend.get_default_loopback()
 
         assert device is not None
         assert device.device_id == "some_other.monitor"
 
-    @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=True)
-    @patch("pulsectl.Pulse")
-    def test_list_loopback_devices_success(self, mock_pulse_class: MagicMock, _: MagicMock) -> None:
+    def test_list_loopback_devices_success(
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
+    ) -> None:
         """Should return list of all monitor devices."""
-        mock_pulse = MagicMock()
-        mock_pulse_class.return_value.__enter__.return_value = mock_pulse
-
         mock_pulse.server_info.return_value = _create_mock_server_info()
         mock_pulse.source_list.return_value = [
             _create_mock_source(name="sink1.monitor", description="Monitor of Speaker 1"),
@@ -168,7 +161,6 @@ class TestPulseAudioBackend:
             _create_mock_source(name="sink2.monitor", description="Monitor of Speaker 2"),
         ]
 
-        backend = PulseAudioBackend()
         devices = backend.list_loopback_devices()
 
         assert len(devices) == 2
@@ -178,71 +170,130 @@ class TestPulseAudioBackend:
         assert devices[1].device_id == "sink2.monitor"
 
     @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=False)
-    def test_list_loopback_devices_empty_when_unavailable(self, _: MagicMock) -> None:
+    def test_list_loopback_devices_empty_when_unavailable(
+        self, _: MagicMock, backend: PulseAudioBackend
+    ) -> None:
         """Should return empty list when pulsectl is not available."""
-        backend = PulseAudioBackend()
         devices = backend.list_loopback_devices()
         assert devices == []
 
-    @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=True)
-    @patch("pulsectl.Pulse")
     def test_monitors_sorted_by_default_sink(
-        self, mock_pulse_class: MagicMock, _: MagicMock
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
     ) -> None:
         """Should sort monitors with default sink's monitor first."""
-        mock_pulse = MagicMock()
-        mock_pulse_class.return_value.__enter__.return_value = mock_pulse
-
         mock_pulse.server_info.return_value = _create_mock_server_info(default_sink="sink2")
         mock_pulse.source_list.return_value = [
             _create_mock_source(name="sink1.monitor", description="Monitor 1"),
             _create_mock_source(name="sink2.monitor", description="Monitor 2"),
         ]
 
-        backend = PulseAudioBackend()
         devices = backend.list_loopback_devices()
 
         assert len(devices) == 2
         assert devices[0].device_id == "sink2.monitor"
         assert devices[1].device_id == "sink1.monitor"
 
-    @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=True)
-    @patch("pulsectl.Pulse")
-    def test_uses_name_when_no_description(self, mock_pulse_class: MagicMock, _: MagicMock) -> None:
+    def test_uses_name_when_no_description(
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
+    ) -> None:
         """Should use name when description is not available."""
-        mock_pulse = MagicMock()
-        mock_pulse_class.return_value.__enter__.return_value = mock_pulse
-
         mock_pulse.server_info.return_value = _create_mock_server_info()
         mock_pulse.source_list.return_value = [
             _create_mock_source(name="test.monitor", description=None),
         ]
 
-        backend = PulseAudioBackend()
         devices = backend.list_loopback_devices()
 
         assert len(devices) == 1
         assert devices[0].name == "test.monitor"
 
-    def test_get_recording_config_with_device_id(self) -> None:
+    def test_only_monitor_suffix_counts(
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
+    ) -> None:
+        """Only sources whose name ends in .monitor should be listed."""
+        mock_pulse.server_info.return_value = _create_mock_server_info()
+        mock_pulse.source_list.return_value = [
+            _create_mock_source(name="sink1.monitor", description="Monitor 1"),
+            _create_mock_source(name="virtual.monitor.input", description="Not a monitor"),
+        ]
+
+        devices = backend.list_loopback_devices()
+
+        assert [d.device_id for d in devices] == ["sink1.monitor"]
+
+    def test_enumerates_once_per_instance(
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
+    ) -> None:
+        """Default lookup and listing should share a single enumeration."""
+        mock_pulse.server_info.return_value = _create_mock_server_info(default_sink="sink1")
+        mock_pulse.source_list.return_value = [
+            _create_mock_source(name="sink1.monitor", description="Monitor 1"),
+        ]
+
+        default = backend.get_default_loopback()
+        devices = backend.list_loopback_devices()
+
+        assert devices == [default]
+        assert mock_pulse.source_list.call_count == 1
+
+    def test_invalidate_cache_forces_reenumeration(
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
+    ) -> None:
+        """invalidate_cache() should make the next call query PulseAudio again."""
+        mock_pulse.server_info.return_value = _create_mock_server_info()
+        mock_pulse.source_list.return_value = [
+            _create_mock_source(name="sink1.monitor", description="Monitor 1"),
+        ]
+        assert len(backend.list_loopback_devices()) == 1
+
+        mock_pulse.source_list.return_value = []
+        assert len(backend.list_loopback_devices()) == 1
+
+        backend.invalidate_cache()
+        assert backend.list_loopback_devices() == []
+
+    def test_is_available_reuses_cached_enumeration(
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
+    ) -> None:
+        """is_available() should not reconnect once devices were enumerated."""
+        mock_pulse.server_info.return_value = _create_mock_server_info()
+        mock_pulse.source_list.return_value = []
+
+        backend.list_loopback_devices()
+        assert backend.is_available() is True
+        assert mock_pulse.server_info.call_count == 1
+
+    def test_failed_enumeration_is_not_cached(
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
+    ) -> None:
+        """A failed enumeration should be retried on the next call."""
+        mock_pulse.server_info.side_effect = [
+            Exception("Connection refused"),
+            _create_mock_server_info(),
+        ]
+        mock_pulse.source_list.return_value = [
+            _create_mock_source(name="sink1.monitor", description="Monitor 1"),
+        ]
+
+        assert backend.list_loopback_devices() == []
+        assert len(backend.list_loopback_devices()) == 1
+
+    def test_get_recording_config_with_device_id(self, backend: PulseAudioBackend) -> None:
         """Should return RecordingConfig with PULSE_SOURCE env var."""
-        backend = PulseAudioBackend()
         config = backend.get_recording_config("alsa_output.analog-stereo.monitor")
 
         assert config.env == {"PULSE_SOURCE": "alsa_output.analog-stereo.monitor"}
         assert config.device == "pulse"
 
-    def test_get_recording_config_with_none_device_id(self) -> None:
+    def test_get_recording_config_with_none_device_id(self, backend: PulseAudioBackend) -> None:
         """Should return RecordingConfig with empty env when device_id is None."""
-        backend = PulseAudioBackend()
         config = backend.get_recording_config(None)
 
         assert config.env == {}
         assert config.device == "pulse"
 
-    def test_get_recording_config_with_int_device_id(self) -> None:
+    def test_get_recording_config_with_int_device_id(self, backend: PulseAudioBackend) -> None:
         """Should convert int device_id to string for PULSE_SOURCE."""
-        backend = PulseAudioBackend()
         config = backend.get_recording_config(42)
 
         assert config.env == {"PULSE_SOURCE": "42"}
@@ -252,13 +303,10 @@ class TestPulseAudioBackend:
 class TestPulseAudioBackendExtractedValues:
     """Tests for extracted channel count and sample rate (not hardcoded)."""
 
-    @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=True)
-    @patch("pulsectl.Pulse")
-    def test_extracts_actual_channel_count(self, mock_pulse_class: MagicMock, _: MagicMock) -> None:
+    def test_extracts_actual_channel_count(
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
+    ) -> None:
         """Should extract actual channel count from source (not hardcoded)."""
-        mock_pulse = MagicMock()
-        mock_pulse_class.return_value.__enter__.return_value = mock_pulse
-
         mock_pulse.server_info.return_value = _create_mock_server_info()
         mock_pulse.source_list.return_value = [
             _create_mock_source(
@@ -269,19 +317,15 @@ class TestPulseAudioBackendExtractedValues:
             ),
         ]
 
-        backend = PulseAudioBackend()
         devices = backend.list_loopback_devices()
 
         assert len(devices) == 1
         assert devices[0].channels == 6
 
-    @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=True)
-    @patch("pulsectl.Pulse")
-    def test_extracts_actual_sample_rate(self, mock_pulse_class: MagicMock, _: MagicMock) -> None:
+    def test_extracts_actual_sample_rate(
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
+    ) -> None:
         """Should extract actual sample rate from source (not hardcoded)."""
-        mock_pulse = MagicMock()
-        mock_pulse_class.return_value.__enter__.return_value = mock_pulse
-
         mock_pulse.server_info.return_value = _create_mock_server_info()
         mock_pulse.source_list.return_value = [
             _create_mock_source(
@@ -292,61 +336,62 @@ class TestPulseAudioBackendExtractedValues:
             ),
         ]
 
-        backend = PulseAudioBackend()
         devices = backend.list_loopback_devices()
 
         assert len(devices) == 1
         assert devices[0].sample_rate == 96000.0
 
-    @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=True)
-    @patch("pulsectl.Pulse")
     def test_uses_default_channel_count_when_missing(
-        self, mock_pulse_class: MagicMock, _: MagicMock
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
     ) -> None:
         """Should use default channel count when source doesn't provide it."""
-        mock_pulse = MagicMock()
-        mock_pulse_class.return_value.__enter__.return_value = mock_pulse
-
         mock_pulse.server_info.return_value = _create_mock_server_info()
-        source = MagicMock()
-        source.name = "test.monitor"
-        source.description = "Test Monitor"
-        del source.channel_count
-        source.sample_spec = MagicMock(rate=48000)
+        source = SimpleNamespace(
+            name="test.monitor",
+            description="Test Monitor",
+            sample_spec=SimpleNamespace(rate=48000),
+        )
 
         mock_pulse.source_list.return_value = [source]
 
-        backend = PulseAudioBackend()
         devices = backend.list_loopback_devices()
 
         assert len(devices) == 1
         assert devices[0].channels == 2
 
-    @patch("hark.audio_backends.pulseaudio._check_pulsectl_available", return_value=True)
-    @patch("pulsectl.Pulse")
     def test_uses_default_sample_rate_when_missing(
-        self, mock_pulse_class: MagicMock, _: MagicMock
+        self, mock_pulse: MagicMock, backend: PulseAudioBackend
     ) -> None:
         """Should use default sample rate when source doesn't provide it."""
-        mock_pulse = MagicMock()
-        mock_pulse_class.return_value.__enter__.return_value = mock_pulse
-
         mock_pulse.server_info.return_value = _create_mock_server_info()
-        source = MagicMock()
-        source.name = "test.monitor"
-        source.description = "Test Monitor"
-        source.channel_count = 2
-        source.sample_spec = None
+        source = SimpleNamespace(
+            name="test.monitor",
+            description="Test Monitor",
+            channel_count=2,
+            sample_spec=None,
+        )
 
         mock_pulse.source_list.return_value = [source]
 
-        backend = PulseAudioBackend()
         devices = backend.list_loopback_devices()
 
         assert len(devices) == 1
         assert devices[0].sample_rate == 44100.0
 
 
+class TestCheckPulsectlAvailable:
+    """Tests for the import-time pulsectl availability probe."""
+
+    def test_reports_module_level_result(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should return the value resolved at import without re-probing."""
+        from hark.audio_backends import pulseaudio
+
+        monkeypatch.setattr(pulseaudio, "_PULSECTL_AVAILABLE", False)
+        with patch("importlib.util.find_spec") as mock_find_spec:
+            assert pulseaudio._check_pulsectl_available() is False
+        mock_find_spec.assert_not_called()
+
+
 class TestPulseAudioBackendExports:
     """Tests for pulseaudio module exports."""
 
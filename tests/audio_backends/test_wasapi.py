@@ -29,197 +29,221 @@ def _create_mock_wasapi_device(
     }
 
 
+@pytest.fixture
+def pyaudio_module(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Install a mock pyaudiowpatch module and mark it available."""
+    module = MagicMock()
+    monkeypatch.setitem(sys.modules, "pyaudiowpatch", module)
+    monkeypatch.setattr("hark.audio_backends.wasapi._check_pyaudiowpatch_available", lambda: True)
+    return module
+
+
+@pytest.fixture
+def mock_pyaudio(pyaudio_module: MagicMock) -> MagicMock:
+    """Return the PyAudio session mock opened by the backend."""
+    return pyaudio_module.PyAudio.return_value.__enter__.return_value
+
+
+@pytest.fixture
+def backend() -> WASAPIBackend:
+    """Create a WASAPI backend under test."""
+    return WASAPIBackend()
+
+
 class TestWASAPIBackend:
     """Tests for WASAPIBackend implementation."""
 
-    def test_implements_loopback_backend(self) -> None:
+    def test_implements_loopback_backend(self, backend: WASAPIBackend) -> None:
         """WASAPIBackend should implement LoopbackBackend protocol."""
-        backend = WASAPIBackend()
         assert isinstance(backend, LoopbackBackend)
 
-    def test_is_available_success(self) -> None:
+    def test_is_available_success(self, mock_pyaudio: MagicMock, backend: WASAPIBackend) -> None:
         """Should return True when PyAudioWPatch works."""
-        # Create mock pyaudiowpatch module
-        mock_pyaudio_module = MagicMock()
-        mock_pyaudio_instance = MagicMock()
-        mock_pyaudio_module.PyAudio.return_value.__enter__.return_value = mock_pyaudio_instance
-        mock_pyaudio_instance.get_default_wasapi_loopback.return_value = _create_mock_wasapi_device(
+        mock_pyaudio.get_default_wasapi_loopback.return_value = _create_mock_wasapi_device(
             0, "Speakers [Loopback]"
         )
 
-        with (
-            patch.dict(sys.modules, {"pyaudiowpatch": mock_pyaudio_module}),
-            patch("hark.audio_backends.wasapi._check_pyaudiowpatch_available", return_value=True),
-        ):
-            backend = WASAPIBackend()
-            assert backend.is_available() is True
+        assert backend.is_available() is True
 
     @patch("hark.audio_backends.wasapi._check_pyaudiowpatch_available", return_value=False)
-    def test_is_available_pyaudiowpatch_not_installed(self, _: MagicMock) -> None:
+    def test_is_available_pyaudiowpatch_not_installed(
+        self, _: MagicMock, backend: WASAPIBackend
+    ) -> None:
         """Should return False when PyAudioWPatch is not installed."""
-        backend = WASAPIBackend()
         assert backend.is_available() is False
 
-    def test_is_available_no_loopback_device(self) -> None:
+    def test_is_available_no_loopback_device(
+        self, mock_pyaudio: MagicMock, backend: WASAPIBackend
+    ) -> None:
         """Should return False when no WASAPI loopback device available."""
-        # Create mock pyaudiowpatch module
-        mock_pyaudio_module = MagicMock()
-        mock_pyaudio_instance = MagicMock()
-        mock_pyaudio_module.PyAudio.return_value.__enter__.return_value = mock_pyaudio_instance
-        mock_pyaudio_instance.get_default_wasapi_loopback.side_effect = OSError(
-            "No loopback device"
-        )
+        mock_pyaudio.get_default_wasapi_loopback.side_effect = OSError("No loopback device")
 
-        with (
-            patch.dict(sys.modules, {"pyaudiowpatch": mock_pyaudio_module}),
-            patch("hark.audio_backends.wasapi._check_pyaudiowpatch_available", return_value=True),
-        ):
-            backend = WASAPIBackend()
-            assert backend.is_available() is False
+        assert backend.is_available() is False
 
-    def test_get_default_loopback_success(self) -> None:
+    def test_get_default_loopback_success(
+        self, mock_pyaudio: MagicMock, backend: WASAPIBackend
+    ) -> None:
         """Should return loopback device info when available."""
-        # Create mock pyaudiowpatch module
-        mock_pyaudio_module = MagicMock()
-        mock_pyaudio_instance = MagicMock()
-        mock_pyaudio_module.PyAudio.return_value.__enter__.return_value = mock_pyaudio_instance
-        mock_pyaudio_instance.get_default_wasapi_loopback.return_value = _create_mock_wasapi_device(
+        mock_pyaudio.get_default_wasapi_loopback.return_value = _create_mock_wasapi_device(
             index=3,
             name="Speakers (Realtek High Definition Audio) [Loopback]",
             max_input_channels=2,
             default_sample_rate=48000.0,
         )
 
-        with (
-            patch.dict(sys.modules, {"pyaudiowpatch": mock_pyaudio_module}),
-            patch("hark.audio_backends.wasapi._check_pyaudiowpatch_available", return_value=True),
-        ):
-            backend = WASAPIBackend()
-            device = backend.get_default_loopback()
+        device = backend.get_default_loopback()
 
-            assert device is not None
-            assert device.name == "Speakers (Realtek High Definition Audio) [Loopback]"
-            assert device.device_id == 3
-            assert device.channels == 2
-            assert device.sample_rate == 48000.0
+        assert device is not None
+        assert device.name == "Speakers (Realtek High Definition Audio) [Loopback]"
+        assert device.device_id == 3
+        assert device.channels == 2
+        assert device.sample_rate == 48000.0
 
-    def test_get_default_loopback_returns_none_on_error(self) -> None:
+    def test_get_default_loopback_returns_none_on_error(
+        self, mock_pyaudio: MagicMock, backend: WASAPIBackend
+    ) -> None:
         """Should return None when no loopback available."""
-        # Create mock pyaudiowpatch module
-        mock_pyaudio_module = MagicMock()
-        mock_pyaudio_instance = MagicMock()
-        mock_pyaudio_module.PyAudio.return_value.__enter__.return_value = mock_pyaudio_instance
-        mock_pyaudio_instance.get_default_wasapi_loopback.side_effect = OSError("No device")
-
-        with (
-            patch.dict(sys.modules, {"pyaudiowpatch": mock_pyaudio_module}),
-            patch("hark.audio_backends.wasapi._check_pyaudiowpatch_available", return_value=True),
-        ):
-            backend = WASAPIBackend()
-            device = backend.get_default_loopback()
-            assert device is None
+        mock_pyaudio.get_default_wasapi_loopback.side_effect = OSError("No device")
+
+        assert backend.get_default_loopback() is None
 
     @patch("hark.audio_backends.wasapi._check_pyaudiowpatch_available", return_value=False)
-    def test_get_default_loopback_unavailable(self, _: MagicMock) -> None:
+    def test_get_default_loopback_unavailable(self, _: MagicMock, backend: WASAPIBackend) -> None:
         """Should return None when PyAudioWPatch unavailable."""
-        backend = WASAPIBackend()
         device = backend.get_default_loopback()
         assert device is None
 
-    def test_list_loopback_devices_success(self) -> None:
+    def test_list_loopback_devices_success(
+        self, mock_pyaudio: MagicMock, backend: WASAPIBackend
+    ) -> None:
         """Should list all WASAPI loopback devices."""
         mock_devices = [
             _create_mock_wasapi_device(0, "Speakers [Loopback]"),
             _create_mock_wasapi_device(1, "Headphones [Loopback]"),
         ]
+        mock_pyaudio.get_loopback_device_info_generator.return_value = iter(mock_devices)
+        mock_pyaudio.get_default_wasapi_loopback.return_value = mock_devices[0]
+
+        devices = backend.list_loopback_devices()
 
-        # Create mock pyaudiowpatch module
-        mock_pyaudio_module = MagicMock()
-        mock_pyaudio_instance = MagicMock()
-        mock_pyaudio_module.PyAudio.return_value.__enter__.return_value = mock_pyaudio_instance
-        mock_pyaudio_instance.get_loopback_device_info_generator.return_value = iter(mock_devices)
-        mock_pyaudio_instance.get_default_wasapi_loopback.return_value = mock_devices[0]
-
-        with (
-            patch.dict(sys.modules, {"pyaudiowpatch": mock_pyaudio_module}),
-            patch("hark.audio_backends.wasapi._check_pyaudiowpatch_available", return_value=True),
-        ):
-            backend = WASAPIBackend()
-            devices = backend.list_loopback_devices()
-
-            assert len(devices) == 2
-            assert devices[0].name == "Speakers [Loopback]"
-            assert devices[1].name == "Headphones [Loopback]"
-
-    def test_list_loopback_devices_sorted_by_default(self) -> None:
+        assert len(devices) == 2
+        assert devices[0].name == "Speakers [Loopback]"
+        assert devices[1].name == "Headphones [Loopback]"
+
+    def test_list_loopback_devices_sorted_by_default(
+        self, mock_pyaudio: MagicMock, backend: WASAPIBackend
+    ) -> None:
         """Should sort with default loopback first."""
         mock_devices = [
             _create_mock_wasapi_device(0, "Speakers [Loopback]"),
             _create_mock_wasapi_device(1, "Headphones [Loopback]"),  # Default
         ]
+        mock_pyaudio.get_loopback_device_info_generator.return_value = iter(mock_devices)
+        mock_pyaudio.get_default_wasapi_loopback.return_value = mock_devices[1]
+
+        devices = backend.list_loopback_devices()
 
-        # Create mock pyaudiowpatch module
-        mock_pyaudio_module = MagicMock()
-        mock_pyaudio_instance = MagicMock()
-        mock_pyaudio_module.PyAudio.return_value.__enter__.return_value = mock_pyaudio_instance
-        mock_pyaudio_instance.get_loopback_device_info_generator.return_value = iter(mock_devices)
-        mock_pyaudio_instance.get_default_wasapi_loopback.return_value = mock_devices[1]
-
-        with (
-            patch.dict(sys.modules, {"pyaudiowpatch": mock_pyaudio_module}),
-            patch("hark.audio_backends.wasapi._check_pyaudiowpatch_available", return_value=True),
-        ):
-            backend = WASAPIBackend()
-            devices = backend.list_loopback_devices()
-
-            assert len(devices) == 2
-            # Headphones should be first (it's the default)
-            assert devices[0].device_id == 1
-            assert devices[1].device_id == 0
+        assert len(devices) == 2
+        # Headphones should be first (it's the default)
+        assert devices[0].device_id == 1
+        assert devices[1].device_id == 0
 
     @patch("hark.audio_backends.wasapi._check_pyaudiowpatch_available", return_value=False)
-    def test_list_loopback_devices_unavailable(self, _: MagicMock) -> None:
+    def test_list_loopback_devices_unavailable(self, _: MagicMock, backend: WASAPIBackend) -> None:
         """Should return empty list when PyAudioWPatch unavailable."""
-        backend = WASAPIBackend()
         devices = backend.list_loopback_devices()
         assert devices == []
 
-    def test_list_loopback_devices_empty_when_no_devices(self) -> None:
+    def test_list_loopback_devices_empty_when_no_devices(
+        self, mock_pyaudio: MagicMock, backend: WASAPIBackend
+    ) -> None:
         """Should return empty list when no loopback devices found."""
-        # Create mock pyaudiowpatch module
-        mock_pyaudio_module = MagicMock()
-        mock_pyaudio_instance = MagicMock()
-        mock_pyaudio_module.PyAudio.return_value.__enter__.return_value = mock_pyaudio_instance
-        mock_pyaudio_instance.get_loopback_device_info_generator.return_value = iter([])
-        mock_pyaudio_instance.get_default_wasapi_loopback.side_effect = OSError("No default")
-
-        with (
-            patch.dict(sys.modules, {"pyaudiowpatch": mock_pyaudio_module}),
-            patch("hark.audio_backends.wasapi._check_pyaudiowpatch_available", return_value=True),
-        ):
-            backend = WASAPIBackend()
-            devices = backend.list_loopback_devices()
-            assert devices == []
-
-    def test_get_recording_config_with_device_id(self) -> None:
+        mock_pyaudio.get_loopback_device_info_generator.return_value = iter([])
+        mock_pyaudio.get_default_wasapi_loopback.side_effect = OSError("No default")
+
+        assert backend.list_loopback_devices() == []
+
+    def test_default_survives_failing_device_walk(
+        self, mock_pyaudio: MagicMock, backend: WASAPIBackend
+    ) -> None:
+        """A failing device generator should still report the default loopback."""
+        mock_pyaudio.get_default_wasapi_loopback.return_value = _create_mock_wasapi_device(
+            3, "Speakers [Loopback]"
+        )
+        mock_pyaudio.get_loopback_device_info_generator.side_effect = OSError("Enumeration failed")
+
+        assert backend.is_available() is True
+        default = backend.get_default_loopback()
+        assert default is not None
+        assert default.device_id == 3
+        assert backend.list_loopback_devices() == [default]
+
+    def test_enumerates_once_within_ttl(
+        self, pyaudio_module: MagicMock, mock_pyaudio: MagicMock, backend: WASAPIBackend
+    ) -> None:
+        """Repeated lookups within the TTL should reuse a single PyAudio session."""
+        speakers = _create_mock_wasapi_device(0, "Speakers [Loopback]")
+        mock_pyaudio.get_loopback_device_info_generator.return_value = iter([speakers])
+        mock_pyaudio.get_default_wasapi_loopback.return_value = speakers
+
+        assert backend.is_available() is True
+        assert backend.get_default_loopback() is not None
+        assert len(backend.list_loopback_devices()) == 1
+
+        pyaudio_module.PyAudio.assert_called_once()
+
+    def test_reenumerates_after_ttl(
+        self, pyaudio_module: MagicMock, mock_pyaudio: MagicMock, backend: WASAPIBackend
+    ) -> None:
+        """An expired cache should trigger a fresh enumeration."""
+        mock_pyaudio.get_loopback_device_info_generator.side_effect = lambda: iter([])
+
+        with patch("hark.audio_backends.wasapi.time.monotonic", side_effect=[100.0, 101.0, 200.0]):
+            backend.list_loopback_devices()
+            backend.list_loopback_devices()
+            backend.list_loopback_devices()
+
+        assert pyaudio_module.PyAudio.call_count == 2
+
+    def test_invalidate_cache_forces_reenumeration(
+        self, pyaudio_module: MagicMock, mock_pyaudio: MagicMock, backend: WASAPIBackend
+    ) -> None:
+        """invalidate_cache() should make the next call enumerate again."""
+        mock_pyaudio.get_loopback_device_info_generator.side_effect = lambda: iter([])
+
+        backend.list_loopback_devices()
+        backend.invalidate_cache()
+        backend.list_loopback_devices()
+
+        assert pyaudio_module.PyAudio.call_count == 2
+
+    def test_failed_enumeration_not_cached(
+        self, pyaudio_module: MagicMock, backend: WASAPIBackend
+    ) -> None:
+        """A failed enumeration should be retried on the next call."""
+        pyaudio_module.PyAudio.side_effect = [OSError("COM failure"), MagicMock()]
+
+        assert backend.list_loopback_devices() == []
+        backend.list_loopback_devices()
+
+        assert pyaudio_module.PyAudio.call_count == 2
+
+    def test_get_recording_config_with_device_id(self, backend: WASAPIBackend) -> None:
         """Should return RecordingConfig with wasapi marker."""
-        backend = WASAPIBackend()
         config = backend.get_recording_config(5)
 
         assert config.env == {}
         assert config.device == "wasapi:5"
 
-    def test_get_recording_config_with_none_device_id(self) -> None:
+    def test_get_recording_config_with_none_device_id(self, backend: WASAPIBackend) -> None:
         """Should return RecordingConfig with wasapi marker (no index)."""
-        backend = WASAPIBackend()
         config = backend.get_recording_config(None)
 
         assert config.env == {}
         assert config.device == "wasapi"
 
-    def test_get_recording_config_with_string_device_id(self) -> None:
+    def test_get_recording_config_with_string_device_id(self, backend: WASAPIBackend) -> None:
         """Should handle string device_id in wasapi marker."""
-        backend = WASAPIBackend()
         config = backend.get_recording_config("some_string")
 
         assert config.env == {}
@@ -1,9 +1,11 @@
 """Tests for DualStreamInterleaver component."""
 
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import numpy as np
+import pytest
 
 from hark.recorder import DualStreamInterleaver, RecordingFileManager
 
@@ -65,6 +67,34 @@ class TestDualStreamInterleaverAddData:
         # Buffer should be unchanged
         assert interleaver.mic_buffer[0][0, 0] == 0.5
 
+    def test_normalizes_to_contiguous_float32(self, tmp_path: Path) -> None:
+        """Should store float32 C-contiguous copies regardless of input layout."""
+        file_manager = RecordingFileManager(tmp_path, 16000, 2)
+        interleaver = DualStreamInterleaver(file_manager)
+
+        data = np.array([[0.5, 0.0], [0.25, 0.0]], dtype=np.float64)[:, :1]
+        interleaver.add_speaker_data(data)
+
+        stored = interleaver.speaker_buffer[0]
+        assert stored.dtype == np.float32
+        assert stored.flags.c_contiguous
+        np.testing.assert_array_equal(stored, [[0.5], [0.25]])
+
+    def test_rejects_integer_pcm(self, tmp_path: Path) -> None:
+        """Should refuse integer PCM instead of casting it unscaled."""
+        file_manager = RecordingFileManager(tmp_path, 16000, 2)
+        interleaver = DualStreamInterleaver(file_manager)
+
+        data = np.array([[32767], [-32768]], dtype=np.int16)
+
+        with pytest.raises(TypeError, match="int16"):
+            interleaver.add_mic_data(data)
+        with pytest.raises(TypeError, match="int16"):
+            interleaver.add_speaker_data(data)
+
+        assert interleaver.mic_buffer == []
+        assert interleaver.speaker_buffer == []
+
 
 class TestDualStreamInterleaverStartStop:
     """Tests for DualStreamInterleaver start/stop methods."""
@@ -130,6 +160,36 @@ class TestDualStreamInterleaverStartStop:
         # Should have written the interleaved data
         assert mock_file.write.called
 
+    def test_wakes_when_chunk_pair_ready(self, tmp_path: Path) -> None:
+        """Should write as soon as both buffers hold a chunk."""
+        file_manager = RecordingFileManager(tmp_path, 16000, 2)
+        written = threading.Event()
+        mock_file = MagicMock()
+        mock_file.closed = False
+        mock_file.write.side_effect = lambda _data: written.set()
+        file_manager._sound_file = mock_file
+
+        interleaver = DualStreamInterleaver(file_manager)
+        interleaver.start()
+
+        interleaver.add_mic_data(np.array([[0.5]], dtype=np.float32))
+        interleaver.add_speaker_data(np.array([[0.3]], dtype=np.float32))
+
+        assert written.wait(timeout=1.0)
+        interleaver.stop()
+
+    def test_stop_wakes_idle_thread(self, tmp_path: Path) -> None:
+        """Should wake and join an idle interleaving thread."""
+        file_manager = RecordingFileManager(tmp_path, 16000, 2)
+        interleaver = DualStreamInterleaver(file_manager)
+        interleaver.start()
+        thread = interleaver._thread
+        assert thread is not None
+
+        interleaver.stop()
+
+        assert not thread.is_alive()
+
 
 class TestDualStreamInterleaverProcessing:
     """Tests for DualStreamInterleaver buffer processing."""
@@ -176,7 +236,7 @@ class TestDualStreamInterleaverProcessing:
         assert written_data.shape[0] == 2  # Truncated to 2
 
     def test_processes_multiple_chunks(self, tmp_path: Path) -> None:
-        """Should process multiple chunk pairs."""
+        """Should process multiple chunk pairs in a single write."""
         file_manager = RecordingFileManager(tmp_path, 16000, 2)
         mock_file = MagicMock()
         mock_file.closed = False
@@ -196,8 +256,88 @@ class TestDualStreamInterleaverProcessing:
 
         interleaver._process_buffers()
 
-        # Should have written twice
-        assert mock_file.write.call_count == 2
+        # Both pairs go out in one write, in order
+        mock_file.write.assert_called_once()
+        written_data = mock_file.write.call_args[0][0]
+        np.testing.assert_array_almost_equal(written_data, [[0.5, 0.3], [0.6, 0.4]])
+
+    def test_truncates_each_pair_in_batch(self, tmp_path: Path) -> None:
+        """Should truncate every pair to its own shorter chunk when batching."""
+        file_manager = RecordingFileManager(tmp_path, 16000, 2)
+        mock_file = MagicMock()
+        mock_file.closed = False
+        file_manager._sound_file = mock_file
+
+        interleaver = DualStreamInterleaver(file_manager)
+
+        interleaver._mic_buffer = [
+            np.full((3, 1), 0.5, dtype=np.float32),
+            np.full((1, 1), 0.6, dtype=np.float32),
+        ]
+        interleaver._speaker_buffer = [
+            np.full((2, 1), 0.3, dtype=np.float32),
+            np.full((2, 1), 0.4, dtype=np.float32),
+        ]
+
+        interleaver._process_buffers()
+
+        written_data = mock_file.write.call_args[0][0]
+        np.testing.assert_array_almost_equal(written_data, [[0.5, 0.3], [0.5, 0.3], [0.6, 0.4]])
+        assert file_manager.frames_written == 3
+
+    def test_keeps_unmatched_chunks_in_order(self, tmp_path: Path) -> None:
+        """Should leave only the unmatched tail queued, oldest first."""
+        file_manager = RecordingFileManager(tmp_path, 16000, 2)
+        mock_file = MagicMock()
+        mock_file.closed = False
+        file_manager._sound_file = mock_file
+
+        interleaver = DualStreamInterleaver(file_manager)
+
+        interleaver._mic_buffer = [np.full((1, 1), float(i), dtype=np.float32) for i in range(4)]
+        interleaver._speaker_buffer = [np.zeros((1, 1), dtype=np.float32) for _ in range(2)]
+
+        interleaver._process_buffers()
+
+        mock_file.write.assert_called_once()
+        assert [chunk[0, 0] for chunk in interleaver._mic_buffer] == [2.0, 3.0]
+        assert interleaver._speaker_buffer == []
+
+    def test_reuses_output_buffer(self, tmp_path: Path) -> None:
+        """Should interleave into the same preallocated buffer on every write."""
+        file_manager = RecordingFileManager(tmp_path, 16000, 2)
+        mock_file = MagicMock()
+        mock_file.closed = False
+        file_manager._sound_file = mock_file
+
+        interleaver = DualStreamInterleaver(file_manager)
+        output = interleaver._output
+
+        interleaver._mic_buffer = [np.array([[0.5]], dtype=np.float32)]
+        interleaver._speaker_buffer = [np.array([[0.3]], dtype=np.float32)]
+        interleaver._process_buffers()
+
+        written_data = mock_file.write.call_args[0][0]
+        assert interleaver._output is output
+        assert np.shares_memory(written_data, output)
+
+    def test_grows_output_buffer_for_large_chunks(self, tmp_path: Path) -> None:
+        """Should grow the output buffer when a chunk exceeds its capacity."""
+        file_manager = RecordingFileManager(tmp_path, 16000, 2)
+        mock_file = MagicMock()
+        mock_file.closed = False
+        file_manager._sound_file = mock_file
+
+        interleaver = DualStreamInterleaver(file_manager)
+        frames = len(interleaver._output) + 1
+
+        interleaver._mic_buffer = [np.full((frames, 1), 0.5, dtype=np.float32)]
+        interleaver._speaker_buffer = [np.full((frames, 1), 0.3, dtype=np.float32)]
+        interleaver._process_buffers()
+
+        written_data = mock_file.write.call_args[0][0]
+        assert written_data.shape == (frames, 2)
+        np.testing.assert_array_almost_equal(written_data[-1], [0.5, 0.3])
 
     def test_waits_for_matching_chunks(self, tmp_path: Path) -> None:
         """Should not write until both buffers have data."""
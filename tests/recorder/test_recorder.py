@@ -180,6 +180,27 @@ class TestAudioRecorderStart:
             with pytest.raises(NoMicrophoneError):
                 recorder.start()
 
+    @pytest.mark.parametrize(
+        ("input_source", "refreshes"), [("mic", False), ("speaker", True), ("both", True)]
+    )
+    def test_refreshes_loopback_devices(
+        self, tmp_path: Path, input_source: str, refreshes: bool
+    ) -> None:
+        """Should re-enumerate loopback devices before resolving speaker sources."""
+        recorder = AudioRecorder(temp_dir=tmp_path, input_source=input_source)
+
+        with (
+            patch("hark.recorder.recorder.refresh_loopback_devices") as mock_refresh,
+            patch(
+                "hark.recorder.recorder.validate_source_availability",
+                return_value=["No microphone device found"],
+            ),
+            pytest.raises(NoMicrophoneError),
+        ):
+            recorder.start()
+
+        assert mock_refresh.called is refreshes
+
     def test_device_busy_error(self, tmp_path: Path) -> None:
         """Should raise AudioDeviceBusyError when device is busy."""
         recorder = AudioRecorder(temp_dir=tmp_path)
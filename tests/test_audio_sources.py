@@ -13,6 +13,7 @@ from hark.audio_sources import (
     find_microphone_device,
     get_devices_for_source,
     list_loopback_devices,
+    refresh_loopback_devices,
     validate_source_availability,
 )
 
@@ -366,6 +367,24 @@ class TestListLoopbackDevices:
             assert devices == []
 
 
+class TestRefreshLoopbackDevices:
+    """Tests for refresh_loopback_devices function."""
+
+    def test_invalidates_backend_cache(self) -> None:
+        """Should drop the cached enumeration of the process-wide backend."""
+        mock_backend = MagicMock()
+
+        with patch("hark.audio_sources.get_loopback_backend", return_value=mock_backend):
+            refresh_loopback_devices()
+
+        mock_backend.invalidate_cache.assert_called_once()
+
+    def test_no_backend_is_noop(self) -> None:
+        """Should do nothing on platforms without a loopback backend."""
+        with patch("hark.audio_sources.get_loopback_backend", side_effect=NotImplementedError):
+            refresh_loopback_devices()
+
+
 class TestGetDevicesForSource:
     """Tests for get_devices_for_source function."""
 
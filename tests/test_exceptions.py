@@ -1,5 +1,10 @@
 """Tests for hark.exceptions module."""
 
+import copy
+import pickle
+import weakref
+from collections.abc import Callable
+
 import pytest
 
 from hark.exceptions import (
@@ -121,6 +126,46 @@ class TestConfigValidationError:
         err = ConfigValidationError(errors)
         assert err.errors is errors
 
+    def test_message_formatted_lazily(self) -> None:
+        """Message should be built on first str() and reused afterwards."""
+        err = ConfigValidationError(["Error A", "Error B"])
+        assert err._msg is None
+        message = str(err)
+        assert message == "Configuration validation failed: Error A; Error B"
+        assert str(err) is message
+
+    def test_message_caps_listed_errors(self) -> None:
+        """Long error lists should be truncated in the message, not in .errors."""
+        errors = [f"Error {i}" for i in range(50)]
+        err = ConfigValidationError(errors)
+        message = str(err)
+        assert "Error 19" in message
+        assert "Error 20" not in message
+        assert message.endswith("(+30 more)")
+        assert len(err.errors) == 50
+
+    def test_message_caps_total_length(self) -> None:
+        """Very long error strings should stop the listing early."""
+        errors = ["x" * 3000, "y" * 3000, "z" * 10]
+        message = str(ConfigValidationError(errors))
+        assert "y" * 3000 in message
+        assert "z" * 10 not in message
+        assert message.endswith("(+1 more)")
+
+    def test_repr_includes_errors(self) -> None:
+        """repr() should show the errors the exception was built from."""
+        err = ConfigValidationError(["Error A", "Error B"])
+        assert repr(err) == "ConfigValidationError(['Error A', 'Error B'])"
+
+    @pytest.mark.parametrize("clone", [copy.copy, lambda e: pickle.loads(pickle.dumps(e))])
+    def test_copy_and_pickle_round_trip(self, clone: Callable[[Exception], Exception]) -> None:
+        """Copies and pickle round-trips should keep errors and message."""
+        err = ConfigValidationError(["Error A", "Error B"])
+        cloned = clone(err)
+        assert isinstance(cloned, ConfigValidationError)
+        assert cloned.errors == ["Error A", "Error B"]
+        assert str(cloned) == str(err)
+
 
 class TestInsufficientDiskSpaceError:
     """Tests for InsufficientDiskSpaceError."""
@@ -154,6 +199,28 @@ class TestInsufficientDiskSpaceError:
         message = str(err)
         assert "100000" in message
 
+    def test_message_formatted_lazily(self) -> None:
+        """Message should be built on first str() and reused afterwards."""
+        err = InsufficientDiskSpaceError(required_mb=500.0, available_mb=120.0)
+        assert err._msg is None
+        message = str(err)
+        assert message == "Insufficient disk space: need 500MB, have 120MB"
+        assert str(err) is message
+
+    def test_repr_includes_sizes(self) -> None:
+        """repr() should show the required and available sizes."""
+        err = InsufficientDiskSpaceError(required_mb=500.0, available_mb=120.0)
+        assert repr(err) == "InsufficientDiskSpaceError(500.0, 120.0)"
+
+    @pytest.mark.parametrize("clone", [copy.copy, lambda e: pickle.loads(pickle.dumps(e))])
+    def test_copy_and_pickle_round_trip(self, clone: Callable[[Exception], Exception]) -> None:
+        """Copies and pickle round-trips should keep sizes and message."""
+        err = InsufficientDiskSpaceError(required_mb=500.0, available_mb=120.0)
+        cloned = clone(err)
+        assert isinstance(cloned, InsufficientDiskSpaceError)
+        assert (cloned.required_mb, cloned.available_mb) == (500.0, 120.0)
+        assert str(cloned) == str(err)
+
 
 class TestAllExceptionsInstantiable:
     """Tests that all exception classes can be instantiated."""
@@ -277,6 +344,13 @@ class TestExceptionRaising:
         except HarkError as err:
             assert err.__cause__ is original
 
+    def test_exceptions_support_weakrefs_and_attributes(self) -> None:
+        """Exceptions should stay weak-referenceable and accept extra attributes."""
+        err = NoMicrophoneError("No microphone")
+        assert weakref.ref(err)() is err
+        err.note = "context"  # type: ignore[attr-defined]
+        assert err.note == "context"  # type: ignore[attr-defined]
+
 
 class TestExceptionRepr:
     """Tests for exception string representations."""